@@ -10,9 +10,25 @@ from data_processor import DataProcessor
 from strategy_manager import StrategyManager
 from fake_account import FakeAccount
 from backtest import Backtest
+from indicators import clear_indicator_cache
 from utils.logger import get_logger
 
 
+def _parse_utc(value: str) -> datetime.datetime:
+    """Parse an ISO date string, treating dates without an offset as UTC.
+    
+    Args:
+        value: Date in format 'YYYY-MM-DDThh:mm:ss'
+    
+    Returns:
+        Timezone-aware datetime
+    """
+    date = datetime.datetime.fromisoformat(value)
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+    return date
+
+
 class TraderBotApp:
     """Main application class for the Trader Bot."""
     
@@ -41,6 +57,8 @@ class TraderBotApp:
         self.backtest_running = False
         self.start_date = None
         self.end_date = None
+        self._start_ms = None
+        self._end_ms = None
         
         # Connect signals
         self.websocket_client.on_message = self._on_websocket_message
@@ -53,6 +71,7 @@ class TraderBotApp:
             symbol: Trading pair symbol (e.g., 'BTC/USDT')
         """
         self.selected_coin = symbol
+        clear_indicator_cache()
         self.logger.info(f"Selected coin: {symbol}")
     
     def connect_websocket(self) -> None:
@@ -138,11 +157,18 @@ class TraderBotApp:
             end_date: End date in format 'YYYY-MM-DDThh:mm:ss'
         """
         try:
-            self.start_date = datetime.datetime.fromisoformat(start_date)
-            self.end_date = datetime.datetime.fromisoformat(end_date)
-            self.logger.info(f"Set date range: {start_date} to {end_date}")
+            start = _parse_utc(start_date)
+            end = _parse_utc(end_date)
         except ValueError as e:
             self.logger.error(f"Invalid date format: {e}")
+            return
+        
+        # Only replace the range once both dates parsed
+        self.start_date = start
+        self.end_date = end
+        self._start_ms = int(start.timestamp() * 1000)
+        self._end_ms = int(end.timestamp() * 1000)
+        self.logger.info(f"Set date range: {start_date} to {end_date}")
     
     def fetch_historical_data(self) -> None:
         """Fetch historical data for backtesting."""
@@ -165,11 +191,13 @@ class TraderBotApp:
         data = self.binance_client.get_historical_klines(
             self.selected_coin,
             self.selected_timeframe,
-            self.start_date,
-            self.end_date
+            self._start_ms,
+            self._end_ms,
+            as_array=True
         )
         
-        # Process data
+        # Process data; indicators cached for the previous frames are stale
+        clear_indicator_cache()
         self.data_processor.process_historical_data(data)
         self.logger.info(f"Fetched {len(data)} historical data points")
     
@@ -279,18 +307,23 @@ class TraderBotApp:
         Args:
             message: WebSocket message
         """
-        # Process real-time data
-        self.data_processor.process_realtime_data(message)
+        # Process real-time data; anything but a kline leaves it unchanged
+        if self.data_processor.process_realtime_data(message) is None:
+            return
         
         # Update strategy if running
         if self.strategy_running and self.selected_strategy:
             strategy = self.strategy_manager.get_strategy(self.selected_strategy)
             if strategy:
-                # Get latest data
-                data = self.data_processor.get_latest_data()
+                # Get latest data as column arrays
+                prices = self.data_processor.get_price_view()
+                if len(prices) < 2:
+                    return
                 
-                # Execute strategy
-                signal = strategy.execute(data)
+                # Execute strategy on the last two rows, sliced once; the
+                # strategy was bound to these columns when it was created
+                prev, last, _, timestamp = prices.tail()
+                signal = strategy.execute_tail(prev, last, timestamp=timestamp)
                 
                 # Handle signal
                 if signal:
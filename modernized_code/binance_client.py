@@ -1,16 +1,153 @@
 #!/usr/bin/env python3
 
 import time
-import hmac
+import json
+import asyncio
 import hashlib
-import requests
+import functools
 import datetime
-from typing import Dict, Any, List, Optional
+import itertools
+import threading
+from typing import Dict, Any, Callable, List, Optional, Tuple, Union
 from urllib.parse import urlencode
 
+import httpx
+import numpy as np
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - optional SIMD JSON parser
+    simdjson = None
+
 from utils.logger import get_logger
 
 
+# Binance request weight budget and klines request cost
+REQUEST_WEIGHT_PER_MINUTE = 1200
+KLINES_WEIGHT = 2
+KLINES_LIMIT = 1000
+KLINE_WIDTH = 12
+MAX_CONCURRENT_REQUESTS = 6
+
+# Seconds to wait for a REST response
+REQUEST_TIMEOUT = 10.0
+
+# Seconds before cached exchange info is fetched again
+EXCHANGE_INFO_TTL = 3600
+
+# Unsigned GET endpoints sent from prebuilt request templates
+_HOT_ENDPOINTS = ('klines', 'time', 'ticker/24hr', 'depth')
+
+# Length in milliseconds of each fixed-length kline interval ('1M' varies)
+_INTERVAL_MS = {
+    '1s': 1000,
+    '1m': 60_000,
+    '3m': 180_000,
+    '5m': 300_000,
+    '15m': 900_000,
+    '30m': 1_800_000,
+    '1h': 3_600_000,
+    '2h': 7_200_000,
+    '4h': 14_400_000,
+    '6h': 21_600_000,
+    '8h': 28_800_000,
+    '12h': 43_200_000,
+    '1d': 86_400_000,
+    '3d': 259_200_000,
+    '1w': 604_800_000
+}
+
+
+# HMAC-SHA256 key padding (RFC 2104) applied with bytes.translate
+_SHA256_BLOCK_SIZE = 64
+_HMAC_IPAD = bytes(b ^ 0x36 for b in range(256))
+_HMAC_OPAD = bytes(b ^ 0x5c for b in range(256))
+
+# Translation table deleting the '/' of CCXT-style symbols
+_SYMBOL_TRANSLATE = str.maketrans({'/': None})
+
+
+# Per-thread simdjson parsers; a Parser must not be shared across threads,
+# and as_list() copies each document out of its buffer
+_parser_local = threading.local()
+
+
+def _json_parser() -> Any:
+    """Get the simdjson parser of the calling thread.
+    
+    Returns:
+        Parser reused by every parse on this thread
+    """
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = _parser_local.parser = simdjson.Parser()
+    return parser
+
+
+def _parse_klines(raw: bytes) -> np.ndarray:
+    """Parse a klines response body straight into a float64 matrix.
+    
+    Args:
+        raw: JSON body of a klines response
+    
+    Returns:
+        Array of shape (n, KLINE_WIDTH) with one kline per row
+    """
+    if simdjson is not None:
+        rows = _json_parser().parse(raw).as_list()
+    else:
+        rows = json.loads(raw)
+    
+    # Numeric strings and ints are converted while filling the matrix
+    return np.fromiter(itertools.chain.from_iterable(rows), dtype=np.float64,
+                       count=len(rows) * KLINE_WIDTH).reshape(len(rows), KLINE_WIDTH)
+
+
+@functools.lru_cache(maxsize=512)
+def _norm(symbol: str) -> str:
+    """Convert a symbol from CCXT format (e.g., 'BTC/USDT') to Binance format.
+    
+    Args:
+        symbol: Trading pair symbol
+    
+    Returns:
+        Symbol without separator (e.g., 'BTCUSDT')
+    """
+    return symbol.translate(_SYMBOL_TRANSLATE)
+
+
+class _RateLimiter:
+    """Token bucket limiting the request weight spent per minute."""
+    
+    def __init__(self, weight_per_minute: int):
+        """Initialize the rate limiter.
+        
+        Args:
+            weight_per_minute: Request weight allowed per minute
+        """
+        self.capacity = float(weight_per_minute)
+        self.tokens = self.capacity
+        self.rate = weight_per_minute / 60.0
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self, weight: int) -> None:
+        """Wait until the given request weight can be spent.
+        
+        Args:
+            weight: Weight of the request
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= weight:
+                    self.tokens -= weight
+                    return
+                await asyncio.sleep((weight - self.tokens) / self.rate)
+
+
 class BinanceClient:
     """Client for interacting with Binance API."""
     
@@ -27,7 +164,15 @@ class BinanceClient:
         self.logger = get_logger()
         self.api_key = api_key
         self.api_secret = api_secret
-        self.session = requests.Session()
+        self._signing_state = self._make_signing_state(api_secret)
+        self._symbol_info_cache: Dict[str, Dict[str, Any]] = {}
+        self._exchange_info_fetched_at = 0.0
+        # HTTP/2 multiplexes requests over one pooled TLS connection
+        self.session = httpx.Client(
+            http2=True,
+            base_url=self.BASE_URL,
+            timeout=REQUEST_TIMEOUT
+        )
         self.session.headers.update({
             'Accept': 'application/json',
             'User-Agent': 'ModernizedTraderBot/1.0'
@@ -36,6 +181,7 @@ class BinanceClient:
             self.session.headers.update({
                 'X-MBX-APIKEY': api_key
             })
+        self._build_request_templates()
     
     def set_api_keys(self, api_key: str, api_secret: str) -> None:
         """Set Binance API keys.
@@ -46,19 +192,60 @@ class BinanceClient:
         """
         self.api_key = api_key
         self.api_secret = api_secret
+        self._signing_state = self._make_signing_state(api_secret)
         self.session.headers.update({
             'X-MBX-APIKEY': api_key
         })
+        self._build_request_templates()
         self.logger.info("API keys set")
     
-    def _get_signed_params(self, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Get signed parameters for authenticated requests.
+    def _build_request_templates(self) -> None:
+        """Precompute the URLs, headers and timeouts of the hot GET endpoints.
+        
+        Requests to these endpoints are built directly from the templates and
+        sent with `session.send`, skipping the client's per-call URL joining
+        and header merging. Must be rebuilt whenever the session headers change.
+        """
+        self._template_urls = {
+            endpoint: f"{self.BASE_URL}/api/{self.API_VERSION}/{endpoint}"
+            for endpoint in _HOT_ENDPOINTS
+        }
+        self._template_headers = httpx.Headers(self.session.headers)
+        self._template_extensions = {'timeout': self.session.timeout.as_dict()}
+    
+    @staticmethod
+    def _make_signing_state(api_secret: Optional[str]) -> Optional[Tuple[Any, Any]]:
+        """Precompute the keyed inner and outer SHA-256 states of HMAC-SHA256.
+        
+        Both states are copied for each signature, so the key padding is
+        hashed only once.
+        
+        Args:
+            api_secret: Binance API secret
+        
+        Returns:
+            Tuple of (inner, outer) hash objects or None if no secret is set
+        """
+        if not api_secret:
+            return None
+        
+        key = api_secret.encode('utf-8')
+        if len(key) > _SHA256_BLOCK_SIZE:
+            key = hashlib.sha256(key).digest()
+        key = key.ljust(_SHA256_BLOCK_SIZE, b'\x00')
+        
+        inner = hashlib.sha256(key.translate(_HMAC_IPAD))
+        outer = hashlib.sha256(key.translate(_HMAC_OPAD))
+        return inner, outer
+    
+    def _get_signed_query(self, params: Dict[str, Any] = None) -> str:
+        """Build the signed query string for authenticated requests.
         
         Args:
             params: Request parameters
         
         Returns:
-            Parameters with signature
+            URL-encoded query string ending with the signature
         """
         if params is None:
             params = {}
@@ -66,21 +253,21 @@ class BinanceClient:
         # Add timestamp
         params['timestamp'] = int(time.time() * 1000)
         
-        # Create signature
+        # Create HMAC-SHA256 signature from copies of the pre-keyed states
         query_string = urlencode(params)
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        
-        # Add signature to parameters
-        params['signature'] = signature
-        
-        return params
+        inner_state, outer_state = self._signing_state
+        inner = inner_state.copy()
+        inner.update(query_string.encode('utf-8'))
+        outer = outer_state.copy()
+        outer.update(inner.digest())
+        signature = outer.hexdigest()
+        
+        # Append signature; the query string is sent as built here
+        return f"{query_string}&signature={signature}"
     
     def _request(self, method: str, endpoint: str, signed: bool = False,
-                params: Dict[str, Any] = None) -> Any:
+                params: Dict[str, Any] = None,
+                decode: Optional[Callable[[bytes], Any]] = None) -> Any:
         """Make a request to the Binance API.
         
         Args:
@@ -88,11 +275,12 @@ class BinanceClient:
             endpoint: API endpoint
             signed: Whether the request needs authentication
             params: Request parameters
+            decode: Parser for the raw response body instead of response.json()
         
         Returns:
             Response data
         """
-        url = f"{self.BASE_URL}/api/{self.API_VERSION}/{endpoint}"
+        url = f"/api/{self.API_VERSION}/{endpoint}"
         
         # Prepare parameters
         if params is None:
@@ -101,11 +289,21 @@ class BinanceClient:
         if signed:
             if not self.api_key or not self.api_secret:
                 raise ValueError("API key and secret required for authenticated requests")
-            params = self._get_signed_params(params)
+            # Signed parameters are encoded once, into the URL itself
+            url = f"{url}?{self._get_signed_query(params)}"
+            params = None
         
         # Make request
         try:
-            if method == 'GET':
+            if method == 'GET' and not signed and endpoint in self._template_urls:
+                # Fast path: only the query string changes between calls
+                url = self._template_urls[endpoint]
+                if params:
+                    url = f"{url}?{urlencode(params)}"
+                request = httpx.Request('GET', url, headers=self._template_headers,
+                                        extensions=self._template_extensions)
+                response = self.session.send(request)
+            elif method == 'GET':
                 response = self.session.get(url, params=params)
             elif method == 'POST':
                 response = self.session.post(url, params=params)
@@ -115,11 +313,13 @@ class BinanceClient:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
             response.raise_for_status()
+            if decode is not None:
+                return decode(response.content)
             return response.json()
         
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             self.logger.error(f"Request error: {e}")
-            if hasattr(e.response, 'text'):
+            if isinstance(e, httpx.HTTPStatusError):
                 self.logger.error(f"Response: {e.response.text}")
             raise
     
@@ -150,15 +350,21 @@ class BinanceClient:
             Symbol information
         """
         # Convert from CCXT format if needed
-        if '/' in symbol:
-            symbol = symbol.replace('/', '')
+        symbol = _norm(symbol)
         
-        exchange_info = self.get_exchange_info()
-        for sym_info in exchange_info['symbols']:
-            if sym_info['symbol'] == symbol:
-                return sym_info
+        # Refresh the symbol lookup table from exchange info when it expires
+        if (not self._symbol_info_cache or
+                time.time() - self._exchange_info_fetched_at > EXCHANGE_INFO_TTL):
+            exchange_info = self.get_exchange_info()
+            self._symbol_info_cache = {
+                sym_info['symbol']: sym_info for sym_info in exchange_info['symbols']
+            }
+            self._exchange_info_fetched_at = time.time()
         
-        raise ValueError(f"Symbol not found: {symbol}")
+        try:
+            return self._symbol_info_cache[symbol]
+        except KeyError:
+            raise ValueError(f"Symbol not found: {symbol}") from None
     
     def get_ticker(self, symbol: str) -> Dict[str, Any]:
         """Get ticker information for a symbol.
@@ -170,8 +376,7 @@ class BinanceClient:
             Ticker information
         """
         # Convert from CCXT format if needed
-        if '/' in symbol:
-            symbol = symbol.replace('/', '')
+        symbol = _norm(symbol)
         
         return self._request('GET', 'ticker/24hr', params={'symbol': symbol})
     
@@ -187,8 +392,7 @@ class BinanceClient:
             List of klines
         """
         # Convert from CCXT format if needed
-        if '/' in symbol:
-            symbol = symbol.replace('/', '')
+        symbol = _norm(symbol)
         
         params = {
             'symbol': symbol,
@@ -199,33 +403,44 @@ class BinanceClient:
         return self._request('GET', 'klines', params=params)
     
     def get_historical_klines(self, symbol: str, interval: str,
-                             start_time: datetime.datetime,
-                             end_time: datetime.datetime) -> List[List]:
+                             start_time: Union[datetime.datetime, int],
+                             end_time: Union[datetime.datetime, int],
+                             as_array: bool = False) -> Union[List[List], np.ndarray]:
         """Get historical klines/candlestick data for a symbol.
         
         Args:
             symbol: Trading pair symbol (e.g., 'BTCUSDT')
             interval: Kline interval (e.g., '1m', '5m', '1h')
-            start_time: Start time
-            end_time: End time
+            start_time: Start time as datetime or milliseconds since epoch
+            end_time: End time as datetime or milliseconds since epoch
+            as_array: Parse the responses directly into a float64 array of
+                shape (n, KLINE_WIDTH) instead of lists
         
         Returns:
-            List of klines
+            List of klines, or an array of klines if as_array is set
         """
         # Convert from CCXT format if needed
-        if '/' in symbol:
-            symbol = symbol.replace('/', '')
+        symbol = _norm(symbol)
         
         # Convert datetime to milliseconds
-        start_ms = int(start_time.timestamp() * 1000)
-        end_ms = int(end_time.timestamp() * 1000)
+        start_ms = start_time if isinstance(start_time, int) else int(start_time.timestamp() * 1000)
+        end_ms = end_time if isinstance(end_time, int) else int(end_time.timestamp() * 1000)
+        
+        decode = _parse_klines if as_array else None
+        
+        # Fixed-length intervals have predictable chunk boundaries, so all
+        # chunks can be fetched concurrently
+        if interval in _INTERVAL_MS:
+            return asyncio.run(
+                self._get_historical_klines_async(symbol, interval, start_ms, end_ms, decode)
+            )
         
         params = {
             'symbol': symbol,
             'interval': interval,
             'startTime': start_ms,
             'endTime': end_ms,
-            'limit': 1000
+            'limit': KLINES_LIMIT
         }
         
         # Fetch data in chunks if needed
@@ -234,21 +449,110 @@ class BinanceClient:
         
         while current_start < end_ms:
             params['startTime'] = current_start
-            klines = self._request('GET', 'klines', params=params)
+            klines = self._request('GET', 'klines', params=params, decode=decode)
             
-            if not klines:
+            if len(klines) == 0:
                 break
             
-            all_klines.extend(klines)
+            if as_array:
+                all_klines.append(klines)
+            else:
+                all_klines.extend(klines)
             
             # Update start time for next chunk
-            current_start = klines[-1][0] + 1
+            current_start = int(klines[-1][0]) + 1
             
             # Avoid rate limiting
             time.sleep(0.1)
         
+        if as_array:
+            return self._concat_klines(all_klines)
         return all_klines
     
+    async def _get_historical_klines_async(self, symbol: str, interval: str,
+                                           start_ms: int, end_ms: int,
+                                           decode: Optional[Callable[[bytes], Any]] = None
+                                           ) -> Union[List[List], np.ndarray]:
+        """Fetch historical klines with several chunk requests in flight.
+        
+        Args:
+            symbol: Trading pair symbol in Binance format (e.g., 'BTCUSDT')
+            interval: Kline interval with a fixed length (e.g., '1m', '1h')
+            start_ms: Start time in milliseconds
+            end_ms: End time in milliseconds
+            decode: `_parse_klines` to return an array, or None for lists
+        
+        Returns:
+            Klines in chronological order, as a list or an array
+        """
+        step = _INTERVAL_MS[interval] * KLINES_LIMIT
+        
+        # Each window spans exactly KLINES_LIMIT candles
+        windows = [(window_start, min(window_start + step - 1, end_ms))
+                   for window_start in range(start_ms, end_ms, step)]
+        
+        url = f"/api/{self.API_VERSION}/klines"
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        rate_limiter = _RateLimiter(REQUEST_WEIGHT_PER_MINUTE)
+        
+        async with httpx.AsyncClient(http2=True, base_url=self.BASE_URL,
+                                     headers=self.session.headers,
+                                     timeout=REQUEST_TIMEOUT) as session:
+            async def fetch(window_start: int, window_end: int) -> Any:
+                params = {
+                    'symbol': symbol,
+                    'interval': interval,
+                    'startTime': window_start,
+                    'endTime': window_end,
+                    'limit': KLINES_LIMIT
+                }
+                async with semaphore:
+                    await rate_limiter.acquire(KLINES_WEIGHT)
+                    try:
+                        response = await session.get(url, params=params)
+                        response.raise_for_status()
+                        if decode is not None:
+                            return decode(response.content)
+                        return response.json()
+                    except httpx.HTTPError as e:
+                        self.logger.error(f"Request error: {e}")
+                        raise
+            
+            chunks = await asyncio.gather(*(fetch(*window) for window in windows))
+        
+        if decode is not None:
+            return self._concat_klines(chunks)
+        
+        # Drop any candle repeated across a window boundary
+        all_klines = []
+        last_open_time = None
+        for chunk in chunks:
+            for kline in chunk:
+                if last_open_time is None or kline[0] > last_open_time:
+                    all_klines.append(kline)
+                    last_open_time = kline[0]
+        
+        return all_klines
+    
+    @staticmethod
+    def _concat_klines(chunks: List[np.ndarray]) -> np.ndarray:
+        """Join kline arrays, dropping candles repeated across chunk boundaries.
+        
+        Args:
+            chunks: Kline arrays of shape (n, KLINE_WIDTH) in chronological order
+        
+        Returns:
+            Array of klines with strictly increasing open times
+        """
+        if not chunks:
+            return np.empty((0, KLINE_WIDTH))
+        
+        klines = np.concatenate(chunks)
+        open_times = klines[:, 0]
+        keep = np.ones(len(klines), dtype=bool)
+        keep[1:] = open_times[1:] > np.maximum.accumulate(open_times)[:-1]
+        return klines[keep]
+    
     def get_depth(self, symbol: str, limit: int = 100) -> Dict[str, Any]:
         """Get order book depth for a symbol.
         
@@ -260,8 +564,7 @@ class BinanceClient:
             Order book depth
         """
         # Convert from CCXT format if needed
-        if '/' in symbol:
-            symbol = symbol.replace('/', '')
+        symbol = _norm(symbol)
         
         params = {
             'symbol': symbol,
@@ -288,8 +591,7 @@ class BinanceClient:
             List of trades
         """
         # Convert from CCXT format if needed
-        if '/' in symbol:
-            symbol = symbol.replace('/', '')
+        symbol = _norm(symbol)
         
         params = {'symbol': symbol}
         return self._request('GET', 'myTrades', signed=True, params=params)
@@ -306,8 +608,7 @@ class BinanceClient:
         params = {}
         if symbol:
             # Convert from CCXT format if needed
-            if '/' in symbol:
-                symbol = symbol.replace('/', '')
+            symbol = _norm(symbol)
             params['symbol'] = symbol
         
         return self._request('GET', 'openOrders', signed=True, params=params)
@@ -327,8 +628,7 @@ class BinanceClient:
             Order information
         """
         # Convert from CCXT format if needed
-        if '/' in symbol:
-            symbol = symbol.replace('/', '')
+        symbol = _norm(symbol)
         
         # Prepare parameters
         params = {
@@ -359,8 +659,7 @@ class BinanceClient:
             Cancellation information
         """
         # Convert from CCXT format if needed
-        if '/' in symbol:
-            symbol = symbol.replace('/', '')
+        symbol = _norm(symbol)
         
         params = {
             'symbol': symbol,
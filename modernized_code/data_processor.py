@@ -1,11 +1,30 @@
 #!/usr/bin/env python3
 
+import logging
+
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 
 from utils.logger import get_logger
-from indicators import calculate_indicators
+from indicators import _bulk_indicators, IndicatorState
+from price_view import PriceView
+import _indicator_jit as ij
+
+
+# Fields of a kline row returned by the Binance API
+KLINE_FIELDS = (
+    'timestamp', 'open', 'high', 'low', 'close', 'volume',
+    'close_time', 'quote_asset_volume', 'number_of_trades',
+    'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
+)
+_FLOAT_FIELDS = (
+    'open', 'high', 'low', 'close', 'volume', 'quote_asset_volume',
+    'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume'
+)
+_FLOAT_FIELD_INDEX = [KLINE_FIELDS.index(field) for field in _FLOAT_FIELDS]
+
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
 
 
 class DataProcessor:
@@ -19,131 +38,295 @@ class DataProcessor:
         """
         self.logger = get_logger()
         self.max_data_points = max_data_points
-        self.data = pd.DataFrame()
-        self.realtime_data = pd.DataFrame()
+        
+        # Provisional values of the candle that is still open
+        self._live_ts: Optional[int] = None
+        self._live_row = np.full(len(OHLCV_COLUMNS), np.nan)
+        
+        # Preallocated get_latest_data rows: the ring tail plus one spare row
+        # for the open candle, wrapped without copying in a cached DataFrame.
+        # Fortran order keeps every column contiguous for get_price_view.
+        self._latest_arr = np.empty((0, len(ij.COLUMNS)), order='F')
+        self._latest_ts = np.empty(0, dtype=np.int64)
+        self._latest_lookback: Optional[int] = None
+        self._latest_view: Optional[pd.DataFrame] = None
+        self._latest_view_key = None
+        self._latest_prices: Optional[PriceView] = None
+        self._tail_dirty = True
+        
+        # Closed candles and their indicators, updated in O(1) per candle.
+        # The ring is never smaller than the longest indicator window so every
+        # sliding-window update can read the value leaving the window.
+        self._indicators = IndicatorState(max_data_points)
+        self._ts = np.zeros(self._indicators.capacity, dtype=np.int64)
+        
+        # DataFrame view with indicators, rebuilt lazily after the buffer changes
+        self._frame = pd.DataFrame()
+        self._stale = False
+        
+        ij.warmup()
+    
+    @property
+    def realtime_data(self) -> pd.DataFrame:
+        """DataFrame with the candle that is still open, if any."""
+        if self._live_ts is None:
+            return pd.DataFrame()
+        return pd.DataFrame([self._live_row], columns=list(OHLCV_COLUMNS),
+                            index=pd.to_datetime([self._live_ts], unit='ms'))
+    
+    @property
+    def data(self) -> pd.DataFrame:
+        """DataFrame with OHLCV data and indicators.
+        
+        The frame is materialized from the ring buffer only when it is read
+        after a new candle was closed.
+        """
+        if self._stale:
+            self._frame = self._buffer_frame()
+            self._stale = False
+        return self._frame
     
-    def process_historical_data(self, klines: List[List]) -> pd.DataFrame:
+    def _buffer_frame(self) -> pd.DataFrame:
+        """Build a DataFrame from the ring buffer in chronological order.
+        
+        Like the earlier concat-and-trim, the frame is cut to the last
+        max_data_points candles. Kline fields the ring does not store, such
+        as close_time or number_of_trades, are carried over from the previous
+        frame and are missing for the candles closed since.
+        
+        Returns:
+            DataFrame with the last max_data_points candles, indexed by open time
+        """
+        count = min(self._indicators.count, self.max_data_points)
+        order = self._indicators.positions(count)
+        index = pd.DatetimeIndex(pd.to_datetime(self._ts[order], unit='ms'),
+                                 name='timestamp')
+        
+        frame = pd.DataFrame(
+            self._indicators.buf[:len(ij.COLUMNS), order].T.astype(np.float64),
+            columns=list(ij.COLUMNS),
+            index=index
+        )
+        
+        previous = self._frame
+        extra = [col for col in previous.columns if col not in frame.columns]
+        if extra:
+            previous = previous[~previous.index.duplicated(keep='last')]
+            frame = frame.join(previous[extra].reindex(index))
+            frame = frame[list(previous.columns) +
+                          [col for col in ij.COLUMNS if col not in previous.columns]]
+        return frame
+    
+    def _load_buffer(self, timestamps: np.ndarray, buf: np.ndarray,
+                     state: np.ndarray) -> None:
+        """Seed the ring buffer and indicator state from a bulk indicator pass.
+        
+        Args:
+            timestamps: Candle open times in milliseconds
+            buf: Indicator buffer of shape (N_FIELDS, n) from `_bulk_indicators`
+            state: Running indicator state after the last candle
+        """
+        n = self._indicators.load(buf, state)
+        self._ts[:n] = timestamps[len(timestamps) - n:]
+    
+    def process_historical_data(self, klines: Union[List[List], np.ndarray]) -> pd.DataFrame:
         """Process historical klines data.
         
         Args:
-            klines: List of klines from Binance API
+            klines: List of klines from Binance API, or an already numeric
+                array of shape (n, 12) from `get_historical_klines(as_array=True)`
         
         Returns:
             Processed DataFrame with indicators
         """
-        # Create DataFrame from klines
-        df = pd.DataFrame(klines, columns=[
-            'timestamp', 'open', 'high', 'low', 'close', 'volume',
-            'close_time', 'quote_asset_volume', 'number_of_trades',
-            'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
-        ])
-        
-        # Convert types
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-        df['close_time'] = pd.to_datetime(df['close_time'], unit='ms')
-        for col in ['open', 'high', 'low', 'close', 'volume', 'quote_asset_volume',
-                   'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume']:
-            df[col] = df[col].astype(float)
-        
-        # Set timestamp as index
-        df.set_index('timestamp', inplace=True)
-        
-        # Calculate indicators
-        df = calculate_indicators(df)
+        if isinstance(klines, np.ndarray):
+            # Parsed straight from the response body; no per-cell objects
+            arr = klines
+        else:
+            # Convert the numeric fields in bulk instead of column by column
+            arr = np.asarray(klines, dtype=object).reshape(len(klines), len(KLINE_FIELDS))
+        floats = arr[:, _FLOAT_FIELD_INDEX].astype(np.float64)
+        
+        columns = dict(zip(_FLOAT_FIELDS, floats.T))
+        columns['close_time'] = pd.to_datetime(arr[:, 6].astype(np.int64), unit='ms')
+        columns['number_of_trades'] = arr[:, 8].astype(np.int64)
+        columns['ignore'] = arr[:, 11]
+        
+        # Index by candle open time
+        index = pd.DatetimeIndex(pd.to_datetime(arr[:, 0].astype(np.int64), unit='ms'),
+                                 name='timestamp')
+        df = pd.DataFrame({col: columns[col] for col in KLINE_FIELDS[1:]}, index=index)
+        
+        # Calculate indicators with the kernel shared with the realtime path
+        buf, state = _bulk_indicators(*(df[col].to_numpy(dtype=np.float64)
+                                        for col in OHLCV_COLUMNS))
+        df = df.assign(**{col: buf[i] for i, col in enumerate(ij.COLUMNS)
+                          if i > ij.VOLUME})
         
         # Store data
-        self.data = df
+        self._frame = df
+        self._stale = False
+        self._tail_dirty = True
+        self._load_buffer(arr[:, 0].astype(np.int64), buf, state)
         
         self.logger.info(f"Processed {len(df)} historical data points")
         return df
     
-    def process_realtime_data(self, message: Dict[str, Any]) -> Optional[pd.DataFrame]:
+    def process_realtime_data(self, message: Any) -> Optional[pd.DataFrame]:
         """Process real-time data from WebSocket.
         
         Args:
-            message: WebSocket message
+            message: WebSocket message, as a dict or a decoded kline struct
         
         Returns:
             Updated DataFrame with indicators or None if data is incomplete
         """
-        # Check if message contains kline data
-        if 'k' not in message:
-            return None
-        
-        kline = message['k']
-        
-        # Extract data
-        timestamp = pd.to_datetime(kline['t'], unit='ms')
-        open_price = float(kline['o'])
-        high_price = float(kline['h'])
-        low_price = float(kline['l'])
-        close_price = float(kline['c'])
-        volume = float(kline['v'])
-        is_closed = kline['x']
+        kline = getattr(message, 'k', None)
+        if kline is not None:
+            # Typed kline struct decoded by the WebSocket client
+            timestamp_ms = kline.t
+            open_price = kline.o
+            high_price = kline.h
+            low_price = kline.l
+            close_price = kline.c
+            volume = kline.v
+            is_closed = kline.x
+        else:
+            # Check if message contains kline data
+            if 'k' not in message:
+                return None
+            
+            kline = message['k']
+            
+            # Extract data
+            timestamp_ms = int(kline['t'])
+            open_price = float(kline['o'])
+            high_price = float(kline['h'])
+            low_price = float(kline['l'])
+            close_price = float(kline['c'])
+            volume = float(kline['v'])
+            is_closed = kline['x']
         
         # Update realtime data
         if is_closed:
-            # If candle is closed, add to historical data
-            new_row = pd.DataFrame({
-                'open': [open_price],
-                'high': [high_price],
-                'low': [low_price],
-                'close': [close_price],
-                'volume': [volume]
-            }, index=[timestamp])
-            
-            # Append to data
-            self.data = pd.concat([self.data, new_row])
+            # If candle is closed, store it in the ring buffer (overwriting
+            # the oldest candle once full) and update its indicators in place
+            pos = self._indicators.append(open_price, high_price, low_price,
+                                          close_price, volume)
+            self._ts[pos] = timestamp_ms
             
-            # Keep only max_data_points
-            if len(self.data) > self.max_data_points:
-                self.data = self.data.iloc[-self.max_data_points:]
+            # The closed candle supersedes its provisional values
+            if self._live_ts == timestamp_ms:
+                self._live_ts = None
             
-            # Recalculate indicators
-            self.data = calculate_indicators(self.data)
+            self._stale = True
+            self._tail_dirty = True
             
-            self.logger.debug(f"Added closed candle at {timestamp}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Added closed candle at %s",
+                                  pd.to_datetime(timestamp_ms, unit='ms'))
         else:
-            # If candle is still open, update realtime data
-            self.realtime_data = pd.DataFrame({
-                'open': [open_price],
-                'high': [high_price],
-                'low': [low_price],
-                'close': [close_price],
-                'volume': [volume]
-            }, index=[timestamp])
+            # If candle is still open, only update its provisional values
+            if timestamp_ms != self._live_ts:
+                self._tail_dirty = True
+            self._live_ts = timestamp_ms
+            self._live_row[:] = (open_price, high_price, low_price, close_price, volume)
             
-            self.logger.debug(f"Updated realtime candle at {timestamp}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Updated realtime candle at %s",
+                                  pd.to_datetime(timestamp_ms, unit='ms'))
         
         return self.get_latest_data()
     
-    def get_latest_data(self, lookback: int = 100) -> pd.DataFrame:
+    def get_latest_data(self, lookback: int = 100, copy: bool = False) -> pd.DataFrame:
         """Get latest data including current realtime candle.
         
         Args:
             lookback: Number of historical candles to include
+            copy: Return a private copy that the caller may modify
         
         Returns:
-            DataFrame with historical and realtime data
+            DataFrame with historical and realtime data. Unless copy is set,
+            the frame is shared between calls until new data arrives and
+            must not be modified. It holds the OHLCV and indicator columns
+            only: the other kline fields (close_time, number_of_trades, ...)
+            are not part of the ring buffer it is served from, and remain
+            available from `get_data`.
         """
-        # Get historical data
-        if len(self.data) == 0:
+        if self._indicators.count == 0:
             return pd.DataFrame()
         
-        # Get last lookback candles
-        hist_data = self.data.iloc[-lookback:].copy()
+        if self._tail_dirty or lookback != self._latest_lookback:
+            self._copy_tail(lookback)
         
-        # Add realtime data if available
-        if not self.realtime_data.empty:
-            # Check if realtime candle already exists in historical data
-            if self.realtime_data.index[0] in hist_data.index:
-                # Replace existing candle
-                hist_data.loc[self.realtime_data.index[0]] = self.realtime_data.iloc[0]
-            else:
-                # Append realtime candle
-                hist_data = pd.concat([hist_data, self.realtime_data])
+        n = len(self._latest_ts)
+        n_prices = len(OHLCV_COLUMNS)
+        live_ts = self._live_ts
+        if live_ts is not None and (n == 0 or live_ts != self._latest_ts[-1]):
+            # Write the open candle into the spare row
+            self._latest_arr[n, :n_prices] = self._live_row
+            rows = n + 1
+        else:
+            if live_ts is not None:
+                # Realtime candle already in the history: replace its prices
+                self._latest_arr[n - 1, :n_prices] = self._live_row
+            rows = n
+        
+        # The frame only needs rebuilding when its index changes
+        if self._latest_view is None or self._latest_view_key != (live_ts, rows):
+            ts = self._latest_ts if rows == n else np.append(self._latest_ts, live_ts)
+            self._latest_view = pd.DataFrame(self._latest_arr[:rows],
+                                             columns=list(ij.COLUMNS),
+                                             index=pd.to_datetime(ts, unit='ms'),
+                                             copy=False)
+            self._latest_view_key = (live_ts, rows)
+            self._latest_prices = None
         
-        return hist_data
+        if copy:
+            return self._latest_view.copy()
+        return self._latest_view
+    
+    def get_price_view(self, lookback: int = 100) -> PriceView:
+        """Get latest data including current realtime candle as column arrays.
+        
+        The arrays are views of the same rows as `get_latest_data`, so both
+        stay in sync without copying.
+        
+        Args:
+            lookback: Number of historical candles to include
+        
+        Returns:
+            PriceView of historical and realtime data; it must not be modified
+        """
+        data = self.get_latest_data(lookback)
+        if len(data) == 0:
+            return PriceView.from_columns(self._latest_arr[:0], self._latest_ts[:0])
+        
+        if self._latest_prices is None:
+            rows = self._latest_view_key[1]
+            ts = data.index.to_numpy(dtype='datetime64[ms]').astype(np.int64)
+            self._latest_prices = PriceView.from_columns(self._latest_arr[:rows], ts)
+        return self._latest_prices
+    
+    def _copy_tail(self, lookback: int) -> None:
+        """Copy the last closed candles from the ring buffer into the latest rows.
+        
+        Args:
+            lookback: Number of historical candles to include
+        """
+        n = max(min(lookback, self._indicators.count, self.max_data_points), 0)
+        if self._latest_arr.shape[0] != n + 1:
+            self._latest_arr = np.empty((n + 1, len(ij.COLUMNS)), order='F')
+        
+        order = self._indicators.positions(n)
+        self._latest_arr[:n] = self._indicators.buf[:len(ij.COLUMNS), order].T
+        self._latest_arr[n, len(OHLCV_COLUMNS):] = np.nan
+        self._latest_ts = self._ts[order]
+        
+        self._latest_lookback = lookback
+        self._latest_view = None
+        self._latest_prices = None
+        self._tail_dirty = False
     
     def has_data(self) -> bool:
         """Check if data is available.
@@ -151,18 +334,27 @@ class DataProcessor:
         Returns:
             True if data is available, False otherwise
         """
-        return not self.data.empty
+        return self._indicators.count > 0
     
-    def get_data(self) -> pd.DataFrame:
+    def get_data(self, copy: bool = False) -> pd.DataFrame:
         """Get all historical data.
         
+        Args:
+            copy: Return a private copy that the caller may modify
+        
         Returns:
-            DataFrame with historical data
+            DataFrame with historical data. Unless copy is set, this is the
+            processor's own frame and must be treated as read-only.
         """
-        return self.data.copy()
+        if copy:
+            return self.data.copy()
+        return self.data
     
     def clear_data(self) -> None:
         """Clear all data."""
-        self.data = pd.DataFrame()
-        self.realtime_data = pd.DataFrame()
+        self._indicators.reset()
+        self._frame = pd.DataFrame()
+        self._stale = False
+        self._live_ts = None
+        self._tail_dirty = True
         self.logger.info("Cleared all data")
@@ -1,8 +1,304 @@
 #!/usr/bin/env python3
 
+import hashlib
+import os
+import threading
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+import _indicator_jit as ij
+
+
+# Most recent calculate_indicators results, keyed by _indicator_cache_key
+INDICATOR_CACHE_SIZE = 8
+_indicator_cache: 'OrderedDict[Tuple, Tuple[pd.DataFrame, pd.DataFrame]]' = OrderedDict()
+_indicator_cache_lock = threading.Lock()
+
+# Background thread for calculate_indicators_async, started on first use
+_indicator_executor: Optional[ThreadPoolExecutor] = None
+
+# On-disk calculate_indicators results, keyed by a hash of the prices. Shorter
+# frames are cheaper to recompute than to hash and load; set the directory to
+# None to disable the cache.
+INDICATOR_DISK_CACHE_DIR: Optional[str] = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'trader_bot', 'indicators')
+INDICATOR_DISK_CACHE_MIN_ROWS = 10000
+
+# Everything besides the prices that determines the cached values
+_DISK_CACHE_VERSION = repr((1, ij.COLUMNS, ij.BB_PERIOD, ij.BB_STD_DEV, ij.RSI_PERIOD,
+                            ij.ATR_PERIOD, ij.STOCH_K_PERIOD, ij.STOCH_D_PERIOD)).encode()
+
+
+def _offset_cumsum(values: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Cumulative sum of values minus the first one, with a leading zero.
+    
+    Offsetting by the first value keeps the running total small for price
+    series, so differences between its entries stay precise.
+    
+    Args:
+        values: Input values without NaN
+    
+    Returns:
+        Tuple of (cumulative sums of length n + 1, offset)
+    """
+    base = values[0] if len(values) else 0.0
+    cumsum = np.zeros(len(values) + 1)
+    np.cumsum(values - base, out=cumsum[1:])
+    return cumsum, base
+
+
+def _window_mean(cumsum: np.ndarray, base: float, period: int) -> np.ndarray:
+    """Trailing window means from an offset cumulative sum.
+    
+    Args:
+        cumsum: Cumulative sums from `_offset_cumsum`
+        base: Offset from `_offset_cumsum`
+        period: Window length
+    
+    Returns:
+        Array of window means, NaN until the window is full
+    """
+    if period < 1:
+        raise ValueError(f"Rolling window must be at least 1: {period}")
+    
+    n = len(cumsum) - 1
+    out = np.full(n, np.nan)
+    if period <= n:
+        out[period - 1:] = (cumsum[period:] - cumsum[:n + 1 - period]) / period + base
+    return out
+
+
+def _rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """Rolling mean over a trailing window, NaN until the window is full.
+    
+    Args:
+        values: Input values
+        period: Window length
+    
+    Returns:
+        Array of rolling means
+    """
+    if np.isnan(values).any():
+        # Cumulative sums cannot skip NaN windows the way rolling() does
+        return pd.Series(values).rolling(window=period).mean().to_numpy()
+    return _window_mean(*_offset_cumsum(values), period)
+
+
+def _calc_sma(values: np.ndarray, periods: List[int]) -> Dict[str, np.ndarray]:
+    """Calculate Simple Moving Averages of a price array.
+    
+    Args:
+        values: Prices
+        periods: List of periods to calculate SMA for
+    
+    Returns:
+        Dictionary of SMA column name to values
+    """
+    if np.isnan(values).any():
+        return {f'sma_{period}': _rolling_mean(values, period) for period in periods}
+    
+    # One cumulative sum shared by all periods
+    cumsum, base = _offset_cumsum(values)
+    return {f'sma_{period}': _window_mean(cumsum, base, period) for period in periods}
+
+
+def _calc_ema(values: np.ndarray, periods: List[int]) -> Dict[str, np.ndarray]:
+    """Calculate Exponential Moving Averages of a price array.
+    
+    Args:
+        values: Prices
+        periods: List of periods to calculate EMA for
+    
+    Returns:
+        Dictionary of EMA column name to values
+    """
+    compiled = ij.JIT_ENABLED and not np.isnan(values).any()
+    columns = {}
+    for period in periods:
+        if compiled:
+            ema = np.empty(len(values))
+            ij.ewma(values, 2.0 / (period + 1), ema)
+        else:
+            ema = pd.Series(values).ewm(span=period, adjust=False).mean().to_numpy()
+        columns[f'ema_{period}'] = ema
+    return columns
+
+
+def _calc_rsi(values: np.ndarray, period: int) -> Dict[str, np.ndarray]:
+    """Calculate the Relative Strength Index of a price array.
+    
+    Args:
+        values: Prices
+        period: RSI period
+    
+    Returns:
+        Dictionary with the 'rsi' column
+    """
+    if len(values) == 0:
+        return {'rsi': np.empty(0)}
+    
+    # Calculate price changes; the first candle (and any NaN) counts as no change
+    delta = np.diff(values, prepend=values[0])
+    
+    # Separate gains and losses with branchless maxima; fmax maps NaN to 0
+    gain = np.fmax(delta, 0.0)
+    loss = np.fmax(np.negative(delta, out=delta), 0.0, out=delta)
+    
+    # Calculate average gain and loss from cumulative sums (no NaN left)
+    avg_gain = _window_mean(*_offset_cumsum(gain), period)
+    avg_loss = _window_mean(*_offset_cumsum(loss), period)
+    
+    # Calculate RS and RSI; a zero average loss gives 100 (or NaN if flat)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = avg_gain / avg_loss
+        return {'rsi': 100 - (100 / (1 + rs))}
+
+
+def _calc_macd(values: np.ndarray, fast_period: int, slow_period: int,
+               signal_period: int) -> Dict[str, np.ndarray]:
+    """Calculate Moving Average Convergence Divergence of a price array.
+    
+    Args:
+        values: Prices
+        fast_period: Fast EMA period
+        slow_period: Slow EMA period
+        signal_period: Signal EMA period
+    
+    Returns:
+        Dictionary with the 'macd', 'macd_signal' and 'macd_histogram' columns
+    """
+    if ij.JIT_ENABLED and not np.isnan(values).any():
+        # Three compiled EMA passes into preallocated arrays
+        n = len(values)
+        fast_ema = np.empty(n)
+        slow_ema = np.empty(n)
+        macd = np.empty(n)
+        signal = np.empty(n)
+        ij.ewma(values, 2.0 / (fast_period + 1), fast_ema)
+        ij.ewma(values, 2.0 / (slow_period + 1), slow_ema)
+        np.subtract(fast_ema, slow_ema, out=macd)
+        ij.ewma(macd, 2.0 / (signal_period + 1), signal)
+        histogram = np.subtract(macd, signal, out=fast_ema)
+    else:
+        # Calculate fast and slow EMAs
+        close = pd.Series(values)
+        fast_ema = close.ewm(span=fast_period, adjust=False).mean()
+        slow_ema = close.ewm(span=slow_period, adjust=False).mean()
+        
+        # Calculate MACD line and signal line
+        macd = (fast_ema - slow_ema).to_numpy()
+        signal = pd.Series(macd).ewm(span=signal_period, adjust=False).mean().to_numpy()
+        histogram = macd - signal
+    
+    return {'macd': macd, 'macd_signal': signal, 'macd_histogram': histogram}
+
+
+def _calc_bollinger_bands(values: np.ndarray, period: int,
+                          std_dev: float) -> Dict[str, np.ndarray]:
+    """Calculate Bollinger Bands of a price array.
+    
+    Args:
+        values: Prices
+        period: SMA period
+        std_dev: Standard deviation multiplier
+    
+    Returns:
+        Dictionary with the 'bb_middle', 'bb_std', 'bb_upper' and 'bb_lower' columns
+    """
+    # Calculate SMA and standard deviation, in one O(n) compiled pass if available
+    if ij.JIT_ENABLED and period > 1:
+        middle, std = ij.rolling_mean_std(values, period)
+    else:
+        rolling = pd.Series(values).rolling(window=period)
+        middle = rolling.mean().to_numpy()
+        std = rolling.std().to_numpy()
+    
+    # Calculate upper and lower bands
+    return {
+        'bb_middle': middle,
+        'bb_std': std,
+        'bb_upper': middle + std * std_dev,
+        'bb_lower': middle - std * std_dev
+    }
+
+
+def _true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """Calculate the True Range of each candle.
+    
+    NaN terms are skipped as in a row-wise pandas max, so the first candle,
+    which has no previous close, gets its high-low range.
+    
+    Args:
+        high: High prices
+        low: Low prices
+        close: Close prices
+    
+    Returns:
+        Array of true ranges
+    """
+    prev_close = np.empty_like(close)
+    prev_close[:1] = np.nan
+    prev_close[1:] = close[:-1]
+    
+    tr = np.abs(high - low)
+    np.fmax(tr, np.abs(high - prev_close), out=tr)
+    np.fmax(tr, np.abs(low - prev_close), out=tr)
+    return tr
+
+
+def _calc_atr(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+              period: int) -> Dict[str, np.ndarray]:
+    """Calculate the Average True Range of price arrays.
+    
+    Args:
+        high: High prices
+        low: Low prices
+        close: Close prices
+        period: ATR period
+    
+    Returns:
+        Dictionary with the 'atr' column
+    """
+    return {'atr': _rolling_mean(_true_range(high, low, close), period)}
+
+
+def _calc_stochastic(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                     k_period: int, d_period: int) -> Dict[str, np.ndarray]:
+    """Calculate the Stochastic Oscillator of price arrays.
+    
+    Args:
+        high: High prices
+        low: Low prices
+        close: Close prices
+        k_period: %K period
+        d_period: %D period
+    
+    Returns:
+        Dictionary with the 'stoch_k' and 'stoch_d' columns
+    """
+    # Calculate %K; the compiled monotonic deque is O(n) for any k_period
+    if ij.JIT_ENABLED:
+        lowest_low = ij.rolling_extreme(low, k_period, False)
+        highest_high = ij.rolling_extreme(high, k_period, True)
+    else:
+        lowest_low = pd.Series(low).rolling(window=k_period).min().to_numpy()
+        highest_high = pd.Series(high).rolling(window=k_period).max().to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        stoch_k = 100 * ((close - lowest_low) / (highest_high - lowest_low))
+    
+    # Calculate %D
+    return {'stoch_k': stoch_k, 'stoch_d': _rolling_mean(stoch_k, d_period)}
+
+
+def _prices(data: pd.DataFrame, column: str) -> np.ndarray:
+    """Read a DataFrame column as a float64 array."""
+    return data[column].to_numpy(dtype=np.float64)
 
 
 def calculate_sma(data: pd.DataFrame, column: str = 'close', periods: List[int] = [20, 50, 200]) -> pd.DataFrame:
@@ -16,12 +312,7 @@ def calculate_sma(data: pd.DataFrame, column: str = 'close', periods: List[int]
     Returns:
         DataFrame with SMA columns added
     """
-    df = data.copy()
-    
-    for period in periods:
-        df[f'sma_{period}'] = df[column].rolling(window=period).mean()
-    
-    return df
+    return data.assign(**_calc_sma(_prices(data, column), periods))
 
 
 def calculate_ema(data: pd.DataFrame, column: str = 'close', periods: List[int] = [12, 26]) -> pd.DataFrame:
@@ -35,12 +326,7 @@ def calculate_ema(data: pd.DataFrame, column: str = 'close', periods: List[int]
     Returns:
         DataFrame with EMA columns added
     """
-    df = data.copy()
-    
-    for period in periods:
-        df[f'ema_{period}'] = df[column].ewm(span=period, adjust=False).mean()
-    
-    return df
+    return data.assign(**_calc_ema(_prices(data, column), periods))
 
 
 def calculate_rsi(data: pd.DataFrame, column: str = 'close', period: int = 14) -> pd.DataFrame:
@@ -54,24 +340,7 @@ def calculate_rsi(data: pd.DataFrame, column: str = 'close', period: int = 14) -
     Returns:
         DataFrame with RSI column added
     """
-    df = data.copy()
-    
-    # Calculate price changes
-    delta = df[column].diff()
-    
-    # Separate gains and losses
-    gain = delta.where(delta > 0, 0)
-    loss = -delta.where(delta < 0, 0)
-    
-    # Calculate average gain and loss
-    avg_gain = gain.rolling(window=period).mean()
-    avg_loss = loss.rolling(window=period).mean()
-    
-    # Calculate RS and RSI
-    rs = avg_gain / avg_loss
-    df['rsi'] = 100 - (100 / (1 + rs))
-    
-    return df
+    return data.assign(**_calc_rsi(_prices(data, column), period))
 
 
 def calculate_macd(data: pd.DataFrame, column: str = 'close', fast_period: int = 12,
@@ -88,18 +357,8 @@ def calculate_macd(data: pd.DataFrame, column: str = 'close', fast_period: int =
     Returns:
         DataFrame with MACD columns added
     """
-    df = data.copy()
-    
-    # Calculate fast and slow EMAs
-    fast_ema = df[column].ewm(span=fast_period, adjust=False).mean()
-    slow_ema = df[column].ewm(span=slow_period, adjust=False).mean()
-    
-    # Calculate MACD line and signal line
-    df['macd'] = fast_ema - slow_ema
-    df['macd_signal'] = df['macd'].ewm(span=signal_period, adjust=False).mean()
-    df['macd_histogram'] = df['macd'] - df['macd_signal']
-    
-    return df
+    return data.assign(**_calc_macd(_prices(data, column), fast_period,
+                                    slow_period, signal_period))
 
 
 def calculate_bollinger_bands(data: pd.DataFrame, column: str = 'close', period: int = 20,
@@ -115,17 +374,7 @@ def calculate_bollinger_bands(data: pd.DataFrame, column: str = 'close', period:
     Returns:
         DataFrame with Bollinger Bands columns added
     """
-    df = data.copy()
-    
-    # Calculate SMA and standard deviation
-    df['bb_middle'] = df[column].rolling(window=period).mean()
-    df['bb_std'] = df[column].rolling(window=period).std()
-    
-    # Calculate upper and lower bands
-    df['bb_upper'] = df['bb_middle'] + (df['bb_std'] * std_dev)
-    df['bb_lower'] = df['bb_middle'] - (df['bb_std'] * std_dev)
-    
-    return df
+    return data.assign(**_calc_bollinger_bands(_prices(data, column), period, std_dev))
 
 
 def calculate_atr(data: pd.DataFrame, period: int = 14) -> pd.DataFrame:
@@ -138,21 +387,8 @@ def calculate_atr(data: pd.DataFrame, period: int = 14) -> pd.DataFrame:
     Returns:
         DataFrame with ATR column added
     """
-    df = data.copy()
-    
-    # Calculate True Range
-    df['tr1'] = abs(df['high'] - df['low'])
-    df['tr2'] = abs(df['high'] - df['close'].shift())
-    df['tr3'] = abs(df['low'] - df['close'].shift())
-    df['tr'] = df[['tr1', 'tr2', 'tr3']].max(axis=1)
-    
-    # Calculate ATR
-    df['atr'] = df['tr'].rolling(window=period).mean()
-    
-    # Drop temporary columns
-    df.drop(['tr1', 'tr2', 'tr3', 'tr'], axis=1, inplace=True)
-    
-    return df
+    return data.assign(**_calc_atr(_prices(data, 'high'), _prices(data, 'low'),
+                                   _prices(data, 'close'), period))
 
 
 def calculate_stochastic(data: pd.DataFrame, k_period: int = 14, d_period: int = 3) -> pd.DataFrame:
@@ -166,44 +402,429 @@ def calculate_stochastic(data: pd.DataFrame, k_period: int = 14, d_period: int =
     Returns:
         DataFrame with Stochastic Oscillator columns added
     """
-    df = data.copy()
+    return data.assign(**_calc_stochastic(_prices(data, 'high'), _prices(data, 'low'),
+                                          _prices(data, 'close'), k_period, d_period))
+
+
+def _ohlcv_arrays(data: pd.DataFrame) -> List[np.ndarray]:
+    """Read the OHLCV columns of a frame as float64 arrays.
     
-    # Calculate %K
-    df['stoch_lowest_low'] = df['low'].rolling(window=k_period).min()
-    df['stoch_highest_high'] = df['high'].rolling(window=k_period).max()
-    df['stoch_k'] = 100 * ((df['close'] - df['stoch_lowest_low']) / 
-                          (df['stoch_highest_high'] - df['stoch_lowest_low']))
+    Only high, low and close are required; missing open or volume columns
+    are returned as NaN.
     
-    # Calculate %D
-    df['stoch_d'] = df['stoch_k'].rolling(window=d_period).mean()
+    Args:
+        data: DataFrame with price data
+    
+    Returns:
+        List of open, high, low, close and volume arrays
+    """
+    missing = np.full(len(data), np.nan)
+    return [data[col].to_numpy(dtype=np.float64) if col in data else missing
+            for col in ('open', 'high', 'low', 'close', 'volume')]
+
+
+def _indicator_cache_key(data: pd.DataFrame) -> Tuple:
+    """Cheap key identifying a price frame and the state of its last candle.
+    
+    The last high, low and close are included because the open candle of a
+    live frame is updated in place without changing its length or index.
+    
+    Args:
+        data: Non-empty DataFrame with price data
+    
+    Returns:
+        Hashable cache key
+    """
+    return (id(data), len(data), data.index[-1], data['close'].iat[-1],
+            data['high'].iat[-1], data['low'].iat[-1])
+
+
+def clear_indicator_cache(disk: bool = False) -> None:
+    """Drop all cached calculate_indicators results.
+    
+    Args:
+        disk: Also delete the results cached on disk
+    """
+    with _indicator_cache_lock:
+        _indicator_cache.clear()
+    if disk and INDICATOR_DISK_CACHE_DIR and os.path.isdir(INDICATOR_DISK_CACHE_DIR):
+        for name in os.listdir(INDICATOR_DISK_CACHE_DIR):
+            if name.endswith('.npz'):
+                os.remove(os.path.join(INDICATOR_DISK_CACHE_DIR, name))
+
+
+def _disk_cache_path(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> str:
+    """Path of the on-disk indicator results for the given prices.
     
-    # Drop temporary columns
-    df.drop(['stoch_lowest_low', 'stoch_highest_high'], axis=1, inplace=True)
+    Args:
+        high: High prices
+        low: Low prices
+        close: Close prices
+    
+    Returns:
+        Path of the .npz file in INDICATOR_DISK_CACHE_DIR
+    """
+    digest = hashlib.blake2b(_DISK_CACHE_VERSION, digest_size=8)
+    for values in (high, low, close):
+        digest.update(np.ascontiguousarray(values))
+    return os.path.join(INDICATOR_DISK_CACHE_DIR, f"{digest.hexdigest()}.npz")
+
+
+def _read_disk_cache(path: str, n: int) -> Optional[np.ndarray]:
+    """Load indicator results saved by `_write_disk_cache`.
+    
+    Args:
+        path: Cache file path
+        n: Expected number of candles
+    
+    Returns:
+        Array of shape (indicators, n), or None if missing or unreadable
+    """
+    try:
+        with np.load(path) as npz:
+            values = npz['indicators']
+    except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+        return None
+    
+    if values.shape != (len(ij.COLUMNS) - ij.VOLUME - 1, n):
+        return None
+    return values
+
+
+def _write_disk_cache(path: str, values: np.ndarray) -> None:
+    """Save indicator results, ignoring failures.
     
-    return df
+    The file is written under a temporary name and moved into place, so
+    concurrent runs never read a partial file.
+    
+    Args:
+        path: Cache file path
+        values: Array of shape (indicators, n)
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, indicators=values)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
 
 
 def calculate_indicators(data: pd.DataFrame) -> pd.DataFrame:
     """Calculate all technical indicators.
     
+    The prices are read into contiguous float64 arrays once and every
+    indicator is computed in a single fused pass of the incremental kernel,
+    instead of one pass (and one DataFrame copy) per indicator function.
+    
+    Results for the last few frames are cached, so strategies evaluating the
+    same unchanged frame share one computation. Call `clear_indicator_cache`
+    after modifying a frame's earlier rows in place.
+    
+    Results for long frames are also saved under INDICATOR_DISK_CACHE_DIR,
+    keyed by a hash of the high, low and close prices, so repeated backtests
+    over the same data skip the computation across runs.
+    
     Args:
         data: DataFrame with price data
     
     Returns:
-        DataFrame with all indicators added
+        DataFrame with all indicators added. It may be shared with other
+        callers and must not be modified.
     """
     if len(data) == 0:
         return data
     
-    df = data.copy()
+    # Entries keep their input frame alive, so its id cannot be reused
+    key = _indicator_cache_key(data)
+    with _indicator_cache_lock:
+        cached = _indicator_cache.get(key)
+        if cached is not None and cached[0] is data:
+            _indicator_cache.move_to_end(key)
+            return cached[1]
+    
+    arrays = _ohlcv_arrays(data)
+    path = None
+    if INDICATOR_DISK_CACHE_DIR and len(data) >= INDICATOR_DISK_CACHE_MIN_ROWS:
+        path = _disk_cache_path(arrays[1], arrays[2], arrays[3])
+    values = _read_disk_cache(path, len(data)) if path else None
+    
+    if values is None:
+        buf, _ = _bulk_indicators(*arrays)
+        values = buf[ij.VOLUME + 1:len(ij.COLUMNS)]
+        if path:
+            _write_disk_cache(path, values)
+    
+    result = data.assign(**dict(zip(ij.COLUMNS[ij.VOLUME + 1:], values)))
+    
+    with _indicator_cache_lock:
+        _indicator_cache[key] = (data, result)
+        if len(_indicator_cache) > INDICATOR_CACHE_SIZE:
+            _indicator_cache.popitem(last=False)
+    return result
+
+
+def calculate_indicators_async(data: pd.DataFrame) -> 'Future[pd.DataFrame]':
+    """Calculate all technical indicators on a background thread.
+    
+    The fused kernel releases the GIL, so a UI event loop keeps running while
+    a long frame is computed. Callbacks added with `Future.add_done_callback`
+    run on the worker thread; a Qt UI should forward the result to the main
+    thread with a signal.
+    
+    Args:
+        data: DataFrame with price data. It must not be modified until the
+            future is done.
     
-    # Calculate indicators
-    df = calculate_sma(df, periods=[20, 50, 200])
-    df = calculate_ema(df, periods=[12, 26])
-    df = calculate_rsi(df)
-    df = calculate_macd(df)
-    df = calculate_bollinger_bands(df)
-    df = calculate_atr(df)
-    df = calculate_stochastic(df)
+    Returns:
+        Future resolving to the `calculate_indicators` result
+    """
+    global _indicator_executor
+    with _indicator_cache_lock:
+        if _indicator_executor is None:
+            _indicator_executor = ThreadPoolExecutor(max_workers=1,
+                                                     thread_name_prefix='indicators')
+    return _indicator_executor.submit(calculate_indicators, data)
+
+
+def _bulk_indicators(open_: np.ndarray, high: np.ndarray, low: np.ndarray,
+                     close: np.ndarray, volume: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate all technical indicators in one pass of the incremental kernel.
+    
+    The realtime path advances the same kernel one candle at a time
+    (`_indicator_jit.append_and_update`), so both paths give identical values.
+    Without a working JIT the per-candle loop would run in the interpreter, so
+    the columns are computed with the vectorized pandas functions instead.
+    
+    Args:
+        open_: Open prices
+        high: High prices
+        low: Low prices
+        close: Close prices
+        volume: Volumes
+    
+    Returns:
+        Tuple of (buffer of shape (N_FIELDS, n) laid out as in `_indicator_jit`,
+        running indicator state after the last candle)
+    """
+    buf = np.empty((ij.N_FIELDS, len(close)), dtype=np.float64)
+    buf[ij.OPEN] = open_
+    buf[ij.HIGH] = high
+    buf[ij.LOW] = low
+    buf[ij.CLOSE] = close
+    buf[ij.VOLUME] = volume
+    
+    state = np.zeros(ij.N_STATE, dtype=np.float64)
+    # A NaN price would stay in the kernel's running sums and EMAs, while the
+    # pandas functions recover once it leaves the window
+    if ij.JIT_ENABLED and not np.isnan(buf[ij.HIGH:ij.CLOSE + 1]).any():
+        ij.bulk_update(buf, state)
+    else:
+        _vectorized_update(buf, state)
+    return buf, state
+
+
+def calculate_indicators_batch(frames: List[pd.DataFrame]) -> List[pd.DataFrame]:
+    """Calculate all technical indicators for several price frames at once.
+    
+    Frames of equal length are stacked into one contiguous (symbol, field,
+    candle) buffer and computed in parallel across symbols. Results are not
+    cached; use `calculate_indicators` for a single frame.
+    
+    Args:
+        frames: DataFrames with price data, e.g. one per symbol or timeframe
+    
+    Returns:
+        List of DataFrames with all indicators added, in input order
+    """
+    results: List[Optional[pd.DataFrame]] = [None] * len(frames)
+    groups: Dict[int, List[int]] = {}
+    for i, data in enumerate(frames):
+        if len(data) == 0:
+            results[i] = data
+        else:
+            groups.setdefault(len(data), []).append(i)
+    
+    for n, members in groups.items():
+        bufs = np.empty((len(members), ij.N_FIELDS, n), dtype=np.float64)
+        for buf, i in zip(bufs, members):
+            buf[:ij.VOLUME + 1] = _ohlcv_arrays(frames[i])
+        states = np.zeros((len(members), ij.N_STATE), dtype=np.float64)
+        
+        # Symbols with a NaN price take the vectorized path, as in
+        # `_bulk_indicators`
+        compiled = ij.JIT_ENABLED & ~np.isnan(bufs[:, ij.HIGH:ij.CLOSE + 1]).any(axis=(1, 2))
+        if compiled.all():
+            ij.bulk_update_batch(bufs, states)
+        elif compiled.any():
+            # Fancy indexing copies, so write the results back
+            subset, subset_states = bufs[compiled], states[compiled]
+            ij.bulk_update_batch(subset, subset_states)
+            bufs[compiled] = subset
+            states[compiled] = subset_states
+        for j in np.flatnonzero(~compiled):
+            _vectorized_update(bufs[j], states[j])
+        
+        for buf, i in zip(bufs, members):
+            results[i] = frames[i].assign(**{col: buf[j] for j, col in enumerate(ij.COLUMNS)
+                                             if j > ij.VOLUME})
+    return results
+
+
+def _vectorized_update(buf: np.ndarray, state: np.ndarray) -> None:
+    """Fill a bulk indicator buffer with the vectorized `_calc_*` functions.
+    
+    Args:
+        buf: Buffer of shape (N_FIELDS, n) with OHLCV rows filled in
+        state: Running state array of length N_STATE, updated in place
+    """
+    n = buf.shape[1]
+    if n == 0:
+        return
+    
+    high, low, close = buf[ij.HIGH], buf[ij.LOW], buf[ij.CLOSE]
+    columns = {}
+    columns.update(_calc_sma(close, [20, 50, 200]))
+    columns.update(_calc_ema(close, [12, 26]))
+    columns.update(_calc_rsi(close, ij.RSI_PERIOD))
+    columns.update(_calc_macd(close, 12, 26, 9))
+    columns.update(_calc_bollinger_bands(close, ij.BB_PERIOD, ij.BB_STD_DEV))
+    columns.update(_calc_atr(high, low, close, ij.ATR_PERIOD))
+    columns.update(_calc_stochastic(high, low, close, ij.STOCH_K_PERIOD, ij.STOCH_D_PERIOD))
+    for i in range(ij.VOLUME + 1, len(ij.COLUMNS)):
+        buf[i] = columns[ij.COLUMNS[i]]
+    
+    # Per-candle window inputs, as stored by the kernel
+    delta = np.diff(close, prepend=close[0])
+    np.fmax(delta, 0.0, out=buf[ij.GAIN])
+    np.fmax(np.negative(delta, out=delta), 0.0, out=buf[ij.LOSS])
+    buf[ij.TR] = _true_range(high, low, close)
+    
+    ij.seed_state(buf, n - 1, n, state)
+    
+    # seed_state leaves the EMAs alone; take them from the computed columns
+    state[ij.S_EMA_12] = columns['ema_12'][-1]
+    state[ij.S_EMA_26] = columns['ema_26'][-1]
+    state[ij.S_SIGNAL] = columns['macd_signal'][-1]
+
+
+class IndicatorState:
+    """Running indicator state, advanced in O(1) per closed candle.
+    
+    Holds the last `capacity` candles and their indicators in a column-wise
+    ring buffer laid out as in `_indicator_jit`, together with the running
+    window sums and EMA scalars, so a new candle never requires recomputing
+    the history.
+    """
     
-    return df
+    def __init__(self, capacity: int = ij.MIN_CAPACITY):
+        """Initialize an empty indicator state.
+        
+        Args:
+            capacity: Number of candles to keep (at least the longest window)
+        """
+        self.capacity = max(capacity, ij.MIN_CAPACITY)
+        self.buf = np.full((ij.N_FIELDS, self.capacity), np.nan, dtype=ij.BUFFER_DTYPE)
+        self.state = np.zeros(ij.N_STATE, dtype=np.float64)
+        self.head = 0
+        self.count = 0
+    
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame, capacity: int = ij.MIN_CAPACITY) -> 'IndicatorState':
+        """Build the state from historical candles in one bulk pass.
+        
+        Args:
+            data: DataFrame with price data
+            capacity: Number of candles to keep
+        
+        Returns:
+            IndicatorState positioned after the last candle of data
+        """
+        indicator_state = cls(capacity)
+        indicator_state.load(*_bulk_indicators(*_ohlcv_arrays(data)))
+        return indicator_state
+    
+    def load(self, buf: np.ndarray, state: np.ndarray) -> int:
+        """Replace the contents with the tail of a bulk indicator pass.
+        
+        Args:
+            buf: Indicator buffer of shape (N_FIELDS, n) from `_bulk_indicators`,
+                cast to `_indicator_jit.BUFFER_DTYPE` as it is copied
+            state: Running indicator state after the last candle
+        
+        Returns:
+            Number of candles kept
+        """
+        n = min(buf.shape[1], self.capacity)
+        self.buf[:, :n] = buf[:, buf.shape[1] - n:]
+        self.state[:] = state
+        
+        self.head = n % self.capacity
+        self.count = n
+        
+        # Window sums must match the rounded values now held in the buffer
+        ij.seed_state(self.buf, (n - 1) % self.capacity, n, self.state)
+        return n
+    
+    def append(self, open_: float, high: float, low: float, close: float,
+               volume: float = np.nan) -> int:
+        """Add a closed candle, overwriting the oldest one once full.
+        
+        Args:
+            open_: Open price
+            high: High price
+            low: Low price
+            close: Close price
+            volume: Volume
+        
+        Returns:
+            Buffer position the candle was written to
+        """
+        pos = self.head
+        ij.append_and_update(self.buf, pos, self.count, open_, high, low, close,
+                             volume, self.state)
+        self.head = (pos + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        
+        # Resync the running sums once per buffer cycle to bound rounding drift
+        if self.head == 0:
+            ij.seed_state(self.buf, self.capacity - 1, self.count, self.state)
+        return pos
+    
+    def update(self, open_: float, high: float, low: float, close: float,
+               volume: float = np.nan) -> Dict[str, float]:
+        """Add a closed candle and return its indicator row.
+        
+        Args:
+            open_: Open price
+            high: High price
+            low: Low price
+            close: Close price
+            volume: Volume
+        
+        Returns:
+            Dictionary of column name to value for the new candle
+        """
+        pos = self.append(open_, high, low, close, volume)
+        return {col: float(self.buf[i, pos]) for i, col in enumerate(ij.COLUMNS)}
+    
+    def positions(self, n: int) -> np.ndarray:
+        """Buffer positions of the last n candles in chronological order.
+        
+        Args:
+            n: Number of candles (at most count)
+        
+        Returns:
+            Array of buffer positions
+        """
+        return (self.head - n + np.arange(n)) % self.capacity
+    
+    def reset(self) -> None:
+        """Forget all candles."""
+        self.head = 0
+        self.count = 0
+        self.state[:] = 0.0
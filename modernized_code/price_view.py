@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+import _indicator_jit as ij
+
+
+@dataclass(frozen=True)
+class PriceView:
+    """Contiguous column arrays of price data and indicators.
+    
+    This is the representation passed to strategies in the live and backtest
+    loops; pandas is only needed at the I/O boundaries. Every column is a
+    separate contiguous float64 array, and arrays may be views into buffers
+    owned by the data processor, so they must not be modified.
+    
+    Attributes:
+        timestamps: Candle open times in milliseconds
+        open: Open prices
+        high: High prices
+        low: Low prices
+        close: Close prices
+        volume: Volumes
+        indicators: Indicator arrays keyed by column name
+    """
+    
+    timestamps: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    indicators: Dict[str, np.ndarray] = field(default_factory=dict)
+    
+    @classmethod
+    def from_columns(cls, values: np.ndarray, timestamps: np.ndarray,
+                     columns: Tuple[str, ...] = ij.COLUMNS) -> 'PriceView':
+        """Wrap the columns of a 2-D array without copying.
+        
+        Args:
+            values: Array of shape (n, len(columns)); Fortran order keeps the
+                column views contiguous
+            timestamps: Candle open times in milliseconds
+            columns: Column names of values, OHLCV first
+        
+        Returns:
+            PriceView over the columns of values
+        """
+        arrays = {name: values[:, i] for i, name in enumerate(columns)}
+        return cls(
+            timestamps=timestamps,
+            open=arrays.pop('open'),
+            high=arrays.pop('high'),
+            low=arrays.pop('low'),
+            close=arrays.pop('close'),
+            volume=arrays.pop('volume'),
+            indicators=arrays
+        )
+    
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame) -> 'PriceView':
+        """Convert a DataFrame with OHLCV and indicator columns.
+        
+        Args:
+            data: DataFrame indexed by open time
+        
+        Returns:
+            PriceView with one contiguous array per column
+        """
+        values = np.asfortranarray(data.to_numpy(dtype=np.float64))
+        timestamps = data.index.to_numpy(dtype='datetime64[ms]').astype(np.int64)
+        return cls.from_columns(values, timestamps, tuple(data.columns))
+    
+    def __len__(self) -> int:
+        """Number of candles."""
+        return len(self.close)
+    
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Get a price or indicator column by name.
+        
+        Args:
+            name: Column name, as in the DataFrame
+        
+        Returns:
+            Column array
+        """
+        if name in ('open', 'high', 'low', 'close', 'volume'):
+            return getattr(self, name)
+        return self.indicators[name]
+    
+    @property
+    def columns(self) -> List[str]:
+        """Column names, in DataFrame order."""
+        return ['open', 'high', 'low', 'close', 'volume'] + list(self.indicators)
+    
+    def tail(self) -> Tuple[np.ndarray, np.ndarray, Dict[str, int], Any]:
+        """Gather the last two rows for `StrategyInterface.execute_tail`.
+        
+        Returns:
+            Tuple of (previous row, last row, column name -> position, last
+            timestamp as a pandas Timestamp)
+        """
+        names = self.columns
+        rows = np.array([self[name][-2:] for name in names]).T
+        col_index = {name: i for i, name in enumerate(names)}
+        return rows[0], rows[1], col_index, pd.Timestamp(self.timestamps[-1], unit='ms')
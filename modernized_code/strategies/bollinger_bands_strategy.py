@@ -1,13 +1,18 @@
 #!/usr/bin/env python3
 
-from typing import Dict, Any, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Any, Optional, Union
 
-import pandas as pd
 import numpy as np
 
-from strategy_interface import StrategyInterface
+from strategy_interface import StrategyInterface, frame_tail
 from utils.logger import get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+    from price_view import PriceView
+
 
 class BollingerBandsStrategy(StrategyInterface):
     """Bollinger Bands Strategy.
@@ -16,6 +21,18 @@ class BollingerBandsStrategy(StrategyInterface):
     and sell signals when price touches the upper band.
     """
     
+    NAME = "Bollinger Bands Strategy"
+    DESCRIPTION = (
+        "Generates buy signals when price touches the lower Bollinger Band, "
+        "and sell signals when price touches the upper Bollinger Band."
+    )
+    DEFAULT_PARAMS = {
+        'period': 20,
+        'std_dev': 2.0,
+        'band_touch_pct': 0.5  # Percentage distance to consider as 'touching' the band
+    }
+    REQUIRED = ('close', 'bb_upper', 'bb_lower')
+    
     def __init__(self, params: Dict[str, Any] = None):
         """Initialize the strategy.
         
@@ -25,13 +42,7 @@ class BollingerBandsStrategy(StrategyInterface):
         super().__init__(params)
         self.logger = get_logger()
         
-        # Set default parameters if not provided
-        default_params = self.get_default_params()
-        for key, value in default_params.items():
-            if key not in self.params:
-                self.params[key] = value
-        
-        self.logger.info(f"Initialized {self.get_name()} with params: {self.params}")
+        self.logger.info("Initialized %s with params: %s", self.get_name(), self.params)
     
     def execute(self, data: pd.DataFrame) -> Optional[Dict[str, Any]]:
         """Execute the strategy on the given data.
@@ -50,22 +61,40 @@ class BollingerBandsStrategy(StrategyInterface):
             self.logger.warning("Bollinger Bands indicators not available")
             return None
         
-        # Get the last row
-        last_row = data.iloc[-1]
+        return self.execute_tail(*frame_tail(data))
+    
+    def execute_tail(self, prev: np.ndarray, last: np.ndarray,
+                     col_index: Optional[Dict[str, int]] = None,
+                     timestamp: Any = None) -> Optional[Dict[str, Any]]:
+        """Execute the strategy on the last two rows of the data.
+        
+        Args:
+            prev: Second to last row values
+            last: Last row values
+            col_index: Mapping of column name to position in the rows;
+                defaults to the positions resolved by `bind`
+            timestamp: Timestamp of the last row
+        
+        Returns:
+            Signal dictionary or None if no signal
+        """
+        col_index = self._column_index(col_index)
+        # Only the last row is needed
+        close = last[col_index['close']]
         
         # Get parameters
         band_touch_pct = self.params['band_touch_pct']
         
         # Calculate distance to bands as percentage
-        lower_band_dist = (last_row['close'] - last_row['bb_lower']) / last_row['close'] * 100
-        upper_band_dist = (last_row['bb_upper'] - last_row['close']) / last_row['close'] * 100
+        lower_band_dist = (close - last[col_index['bb_lower']]) / close * 100
+        upper_band_dist = (last[col_index['bb_upper']] - close) / close * 100
         
         # Check for lower band touch (buy signal)
         if lower_band_dist <= band_touch_pct:
             return {
                 'action': 'buy',
-                'price': last_row['close'],
-                'timestamp': last_row.name,
+                'price': close,
+                'timestamp': timestamp,
                 'reason': f"Price touched lower Bollinger Band (distance: {lower_band_dist:.2f}%)"
             }
         
@@ -73,41 +102,35 @@ class BollingerBandsStrategy(StrategyInterface):
         elif upper_band_dist <= band_touch_pct:
             return {
                 'action': 'sell',
-                'price': last_row['close'],
-                'timestamp': last_row.name,
+                'price': close,
+                'timestamp': timestamp,
                 'reason': f"Price touched upper Bollinger Band (distance: {upper_band_dist:.2f}%)"
             }
         
         # No signal
         return None
     
-    def get_name(self) -> str:
-        """Get the name of the strategy.
+    def generate_signals(self, data: Union[pd.DataFrame, PriceView]) -> np.ndarray:
+        """Generate the signal for every row of the data in one pass.
         
-        Returns:
-            Strategy name
-        """
-        return "Bollinger Bands Strategy"
-    
-    def get_description(self) -> str:
-        """Get the description of the strategy.
+        Args:
+            data: DataFrame or PriceView with price data and indicators
         
         Returns:
-            Strategy description
+            int8 array of length len(data): 1 buy, -1 sell, 0 no signal
         """
-        return (
-            "Generates buy signals when price touches the lower Bollinger Band, "
-            "and sell signals when price touches the upper Bollinger Band."
-        )
-    
-    def get_default_params(self) -> Dict[str, Any]:
-        """Get the default parameters for the strategy.
+        close = np.asarray(data['close'], dtype=np.float64)
+        band_touch_pct = self.params['band_touch_pct']
         
-        Returns:
-            Dictionary of default parameters
-        """
-        return {
-            'period': 20,
-            'std_dev': 2.0,
-            'band_touch_pct': 0.5  # Percentage distance to consider as 'touching' the band
-        }
+        with np.errstate(divide='ignore', invalid='ignore'):
+            lower_band_dist = (close - np.asarray(data['bb_lower'], dtype=np.float64)) / close * 100
+            upper_band_dist = (np.asarray(data['bb_upper'], dtype=np.float64) - close) / close * 100
+        
+        # execute() needs a previous row, so the first row never signals
+        signals = np.zeros(len(close), dtype=np.int8)
+        buy = lower_band_dist <= band_touch_pct
+        sell = ~buy & (upper_band_dist <= band_touch_pct)
+        signals[buy] = 1
+        signals[sell] = -1
+        signals[:1] = 0
+        return signals
@@ -1,13 +1,18 @@
 #!/usr/bin/env python3
 
-from typing import Dict, Any, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Any, Optional, Union
 
-import pandas as pd
 import numpy as np
 
-from strategy_interface import StrategyInterface
+from strategy_interface import StrategyInterface, crossover_signals, frame_tail
 from utils.logger import get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+    from price_view import PriceView
+
 
 class MACDStrategy(StrategyInterface):
     """MACD Strategy.
@@ -16,6 +21,18 @@ class MACDStrategy(StrategyInterface):
     and sell signals when MACD line crosses below signal line.
     """
     
+    NAME = "MACD Strategy"
+    DESCRIPTION = (
+        "Generates buy signals when MACD line crosses above signal line, "
+        "and sell signals when MACD line crosses below signal line."
+    )
+    DEFAULT_PARAMS = {
+        'fast_period': 12,
+        'slow_period': 26,
+        'signal_period': 9
+    }
+    REQUIRED = ('close', 'macd', 'macd_signal')
+    
     def __init__(self, params: Dict[str, Any] = None):
         """Initialize the strategy.
         
@@ -25,13 +42,7 @@ class MACDStrategy(StrategyInterface):
         super().__init__(params)
         self.logger = get_logger()
         
-        # Set default parameters if not provided
-        default_params = self.get_default_params()
-        for key, value in default_params.items():
-            if key not in self.params:
-                self.params[key] = value
-        
-        self.logger.info(f"Initialized {self.get_name()} with params: {self.params}")
+        self.logger.info("Initialized %s with params: %s", self.get_name(), self.params)
     
     def execute(self, data: pd.DataFrame) -> Optional[Dict[str, Any]]:
         """Execute the strategy on the given data.
@@ -50,59 +61,59 @@ class MACDStrategy(StrategyInterface):
             self.logger.warning("MACD indicators not available")
             return None
         
-        # Get the last two rows for crossover detection
-        last_row = data.iloc[-1]
-        prev_row = data.iloc[-2]
+        return self.execute_tail(*frame_tail(data))
+    
+    def execute_tail(self, prev: np.ndarray, last: np.ndarray,
+                     col_index: Optional[Dict[str, int]] = None,
+                     timestamp: Any = None) -> Optional[Dict[str, Any]]:
+        """Execute the strategy on the last two rows of the data.
+        
+        Args:
+            prev: Second to last row values
+            last: Last row values
+            col_index: Mapping of column name to position in the rows;
+                defaults to the positions resolved by `bind`
+            timestamp: Timestamp of the last row
+        
+        Returns:
+            Signal dictionary or None if no signal
+        """
+        col_index = self._column_index(col_index)
+        macd = col_index['macd']
+        signal = col_index['macd_signal']
+        m_prev, s_prev = prev[macd], prev[signal]
+        m_last, s_last = last[macd], last[signal]
         
         # Check for crossover
-        if prev_row['macd'] <= prev_row['macd_signal'] and last_row['macd'] > last_row['macd_signal']:
+        if m_prev <= s_prev and m_last > s_last:
             # MACD crossed above signal line -> Buy signal
             return {
                 'action': 'buy',
-                'price': last_row['close'],
-                'timestamp': last_row.name,
+                'price': last[col_index['close']],
+                'timestamp': timestamp,
                 'reason': "MACD crossed above signal line"
             }
         
-        elif prev_row['macd'] >= prev_row['macd_signal'] and last_row['macd'] < last_row['macd_signal']:
+        elif m_prev >= s_prev and m_last < s_last:
             # MACD crossed below signal line -> Sell signal
             return {
                 'action': 'sell',
-                'price': last_row['close'],
-                'timestamp': last_row.name,
+                'price': last[col_index['close']],
+                'timestamp': timestamp,
                 'reason': "MACD crossed below signal line"
             }
         
         # No signal
         return None
     
-    def get_name(self) -> str:
-        """Get the name of the strategy.
-        
-        Returns:
-            Strategy name
-        """
-        return "MACD Strategy"
-    
-    def get_description(self) -> str:
-        """Get the description of the strategy.
+    def generate_signals(self, data: Union[pd.DataFrame, PriceView]) -> np.ndarray:
+        """Generate the signal for every row of the data in one pass.
         
-        Returns:
-            Strategy description
-        """
-        return (
-            "Generates buy signals when MACD line crosses above signal line, "
-            "and sell signals when MACD line crosses below signal line."
-        )
-    
-    def get_default_params(self) -> Dict[str, Any]:
-        """Get the default parameters for the strategy.
+        Args:
+            data: DataFrame or PriceView with price data and indicators
         
         Returns:
-            Dictionary of default parameters
+            int8 array of length len(data): 1 buy, -1 sell, 0 no signal
         """
-        return {
-            'fast_period': 12,
-            'slow_period': 26,
-            'signal_period': 9
-        }
+        return crossover_signals(np.asarray(data['macd'], dtype=np.float64),
+                                 np.asarray(data['macd_signal'], dtype=np.float64))
@@ -1,13 +1,18 @@
 #!/usr/bin/env python3
 
-from typing import Dict, Any, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Any, Optional, Union
 
-import pandas as pd
 import numpy as np
 
-from strategy_interface import StrategyInterface
+from strategy_interface import StrategyInterface, frame_tail
 from utils.logger import get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+    from price_view import PriceView
+
 
 class RSIStrategy(StrategyInterface):
     """RSI Strategy.
@@ -16,6 +21,18 @@ class RSIStrategy(StrategyInterface):
     and sell signals when RSI crosses above overbought level.
     """
     
+    NAME = "RSI Strategy"
+    DESCRIPTION = (
+        "Generates buy signals when RSI crosses above oversold level, "
+        "and sell signals when RSI crosses below overbought level."
+    )
+    DEFAULT_PARAMS = {
+        'rsi_period': 14,
+        'oversold': 30,
+        'overbought': 70
+    }
+    REQUIRED = ('close', 'rsi')
+    
     def __init__(self, params: Dict[str, Any] = None):
         """Initialize the strategy.
         
@@ -25,13 +42,7 @@ class RSIStrategy(StrategyInterface):
         super().__init__(params)
         self.logger = get_logger()
         
-        # Set default parameters if not provided
-        default_params = self.get_default_params()
-        for key, value in default_params.items():
-            if key not in self.params:
-                self.params[key] = value
-        
-        self.logger.info(f"Initialized {self.get_name()} with params: {self.params}")
+        self.logger.info("Initialized %s with params: %s", self.get_name(), self.params)
     
     def execute(self, data: pd.DataFrame) -> Optional[Dict[str, Any]]:
         """Execute the strategy on the given data.
@@ -50,62 +61,68 @@ class RSIStrategy(StrategyInterface):
             self.logger.warning("RSI indicator not available")
             return None
         
-        # Get the last two rows for crossover detection
-        last_row = data.iloc[-1]
-        prev_row = data.iloc[-2]
+        return self.execute_tail(*frame_tail(data))
+    
+    def execute_tail(self, prev: np.ndarray, last: np.ndarray,
+                     col_index: Optional[Dict[str, int]] = None,
+                     timestamp: Any = None) -> Optional[Dict[str, Any]]:
+        """Execute the strategy on the last two rows of the data.
+        
+        Args:
+            prev: Second to last row values
+            last: Last row values
+            col_index: Mapping of column name to position in the rows;
+                defaults to the positions resolved by `bind`
+            timestamp: Timestamp of the last row
+        
+        Returns:
+            Signal dictionary or None if no signal
+        """
+        col_index = self._column_index(col_index)
+        rsi = col_index['rsi']
+        rsi_prev, rsi_last = prev[rsi], last[rsi]
         
         # Get parameters
         oversold = self.params['oversold']
         overbought = self.params['overbought']
         
         # Check for oversold condition (buy signal)
-        if prev_row['rsi'] < oversold and last_row['rsi'] >= oversold:
+        if rsi_prev < oversold and rsi_last >= oversold:
             return {
                 'action': 'buy',
-                'price': last_row['close'],
-                'timestamp': last_row.name,
+                'price': last[col_index['close']],
+                'timestamp': timestamp,
                 'reason': f"RSI crossed above oversold level ({oversold})"
             }
         
         # Check for overbought condition (sell signal)
-        elif prev_row['rsi'] > overbought and last_row['rsi'] <= overbought:
+        elif rsi_prev > overbought and rsi_last <= overbought:
             return {
                 'action': 'sell',
-                'price': last_row['close'],
-                'timestamp': last_row.name,
+                'price': last[col_index['close']],
+                'timestamp': timestamp,
                 'reason': f"RSI crossed below overbought level ({overbought})"
             }
         
         # No signal
         return None
     
-    def get_name(self) -> str:
-        """Get the name of the strategy.
+    def generate_signals(self, data: Union[pd.DataFrame, PriceView]) -> np.ndarray:
+        """Generate the signal for every row of the data in one pass.
         
-        Returns:
-            Strategy name
-        """
-        return "RSI Strategy"
-    
-    def get_description(self) -> str:
-        """Get the description of the strategy.
+        Args:
+            data: DataFrame or PriceView with price data and indicators
         
         Returns:
-            Strategy description
+            int8 array of length len(data): 1 buy, -1 sell, 0 no signal
         """
-        return (
-            "Generates buy signals when RSI crosses above oversold level, "
-            "and sell signals when RSI crosses below overbought level."
-        )
-    
-    def get_default_params(self) -> Dict[str, Any]:
-        """Get the default parameters for the strategy.
+        rsi = np.asarray(data['rsi'], dtype=np.float64)
+        oversold = self.params['oversold']
+        overbought = self.params['overbought']
         
-        Returns:
-            Dictionary of default parameters
-        """
-        return {
-            'rsi_period': 14,
-            'oversold': 30,
-            'overbought': 70
-        }
+        signals = np.zeros(len(rsi), dtype=np.int8)
+        buy = (rsi[:-1] < oversold) & (rsi[1:] >= oversold)
+        sell = ~buy & (rsi[:-1] > overbought) & (rsi[1:] <= overbought)
+        signals[1:][buy] = 1
+        signals[1:][sell] = -1
+        return signals
@@ -1,13 +1,18 @@
 #!/usr/bin/env python3
 
-from typing import Dict, Any, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Union
 
-import pandas as pd
 import numpy as np
 
-from strategy_interface import StrategyInterface
+from strategy_interface import StrategyInterface, crossover_signals, frame_tail
 from utils.logger import get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+    from price_view import PriceView
+
 
 class SimpleMovingAverageCrossover(StrategyInterface):
     """Simple Moving Average Crossover Strategy.
@@ -16,6 +21,16 @@ class SimpleMovingAverageCrossover(StrategyInterface):
     and sell signals when fast MA crosses below slow MA.
     """
     
+    NAME = "Simple Moving Average Crossover"
+    DESCRIPTION = (
+        "Generates buy signals when fast MA crosses above slow MA, "
+        "and sell signals when fast MA crosses below slow MA."
+    )
+    DEFAULT_PARAMS = {
+        'fast_period': 20,
+        'slow_period': 50
+    }
+    
     def __init__(self, params: Dict[str, Any] = None):
         """Initialize the strategy.
         
@@ -25,13 +40,7 @@ class SimpleMovingAverageCrossover(StrategyInterface):
         super().__init__(params)
         self.logger = get_logger()
         
-        # Set default parameters if not provided
-        default_params = self.get_default_params()
-        for key, value in default_params.items():
-            if key not in self.params:
-                self.params[key] = value
-        
-        self.logger.info(f"Initialized {self.get_name()} with params: {self.params}")
+        self.logger.info("Initialized %s with params: %s", self.get_name(), self.params)
     
     def execute(self, data: pd.DataFrame) -> Optional[Dict[str, Any]]:
         """Execute the strategy on the given data.
@@ -51,61 +60,76 @@ class SimpleMovingAverageCrossover(StrategyInterface):
         
         # Check if required indicators are available
         if fast_ma not in data.columns or slow_ma not in data.columns:
-            self.logger.warning(f"Required indicators not available: {fast_ma}, {slow_ma}")
+            self.logger.warning("Required indicators not available: %s, %s", fast_ma, slow_ma)
             return None
         
-        # Get the last two rows for crossover detection
-        last_row = data.iloc[-1]
-        prev_row = data.iloc[-2]
+        return self.execute_tail(*frame_tail(data))
+    
+    def execute_tail(self, prev: np.ndarray, last: np.ndarray,
+                     col_index: Optional[Dict[str, int]] = None,
+                     timestamp: Any = None) -> Optional[Dict[str, Any]]:
+        """Execute the strategy on the last two rows of the data.
+        
+        Args:
+            prev: Second to last row values
+            last: Last row values
+            col_index: Mapping of column name to position in the rows;
+                defaults to the positions resolved by `bind`
+            timestamp: Timestamp of the last row
+        
+        Returns:
+            Signal dictionary or None if no signal
+        """
+        col_index = self._column_index(col_index)
+        # Get parameters
+        fast_ma = f"sma_{self.params['fast_period']}"
+        slow_ma = f"sma_{self.params['slow_period']}"
+        
+        fast = col_index[fast_ma]
+        slow = col_index[slow_ma]
+        fast_prev, slow_prev = prev[fast], prev[slow]
+        fast_last, slow_last = last[fast], last[slow]
         
         # Check for crossover
-        if prev_row[fast_ma] <= prev_row[slow_ma] and last_row[fast_ma] > last_row[slow_ma]:
+        if fast_prev <= slow_prev and fast_last > slow_last:
             # Fast MA crossed above slow MA -> Buy signal
             return {
                 'action': 'buy',
-                'price': last_row['close'],
-                'timestamp': last_row.name,
+                'price': last[col_index['close']],
+                'timestamp': timestamp,
                 'reason': f"{fast_ma} crossed above {slow_ma}"
             }
         
-        elif prev_row[fast_ma] >= prev_row[slow_ma] and last_row[fast_ma] < last_row[slow_ma]:
+        elif fast_prev >= slow_prev and fast_last < slow_last:
             # Fast MA crossed below slow MA -> Sell signal
             return {
                 'action': 'sell',
-                'price': last_row['close'],
-                'timestamp': last_row.name,
+                'price': last[col_index['close']],
+                'timestamp': timestamp,
                 'reason': f"{fast_ma} crossed below {slow_ma}"
             }
         
         # No signal
         return None
     
-    def get_name(self) -> str:
-        """Get the name of the strategy.
+    def required_columns(self) -> List[str]:
+        """Get the columns the strategy reads.
         
         Returns:
-            Strategy name
+            Close price and the two moving averages selected by the params
         """
-        return "Simple Moving Average Crossover"
+        return ['close', f"sma_{self.params['fast_period']}", f"sma_{self.params['slow_period']}"]
     
-    def get_description(self) -> str:
-        """Get the description of the strategy.
+    def generate_signals(self, data: Union[pd.DataFrame, PriceView]) -> np.ndarray:
+        """Generate the signal for every row of the data in one pass.
         
-        Returns:
-            Strategy description
-        """
-        return (
-            "Generates buy signals when fast MA crosses above slow MA, "
-            "and sell signals when fast MA crosses below slow MA."
-        )
-    
-    def get_default_params(self) -> Dict[str, Any]:
-        """Get the default parameters for the strategy.
+        Args:
+            data: DataFrame or PriceView with price data and indicators
         
         Returns:
-            Dictionary of default parameters
+            int8 array of length len(data): 1 buy, -1 sell, 0 no signal
         """
-        return {
-            'fast_period': 20,
-            'slow_period': 50
-        }
+        fast_ma = f"sma_{self.params['fast_period']}"
+        slow_ma = f"sma_{self.params['slow_period']}"
+        return crossover_signals(np.asarray(data[fast_ma], dtype=np.float64),
+                                 np.asarray(data[slow_ma], dtype=np.float64))
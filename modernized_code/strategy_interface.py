@@ -1,21 +1,119 @@
 #!/usr/bin/env python3
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
+from price_view import PriceView
+
+
+# Signal array codes used by generate_signals
+SIGNAL_CODES = {'buy': 1, 'sell': -1}
+
+
+def crossover_signals(fast: np.ndarray, slow: np.ndarray) -> np.ndarray:
+    """Vectorized crossover of two series.
+    
+    Args:
+        fast: Series that crosses
+        slow: Series crossed
+    
+    Returns:
+        int8 array: 1 where fast crosses above slow, -1 where it crosses below
+    """
+    signals = np.zeros(len(fast), dtype=np.int8)
+    cross_up = (fast[:-1] <= slow[:-1]) & (fast[1:] > slow[1:])
+    cross_down = (fast[:-1] >= slow[:-1]) & (fast[1:] < slow[1:])
+    signals[1:][cross_up] = 1
+    signals[1:][cross_down] = -1
+    return signals
+
+
+def frame_tail(data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, Dict[str, int], Any]:
+    """Slice the last two rows of a frame into plain ndarrays.
+    
+    Args:
+        data: DataFrame with price data and indicators (at least two rows)
+    
+    Returns:
+        Tuple of (previous row, last row, column name -> position, last timestamp)
+    """
+    values = data.iloc[-2:].to_numpy(dtype=np.float64)
+    col_index = {name: i for i, name in enumerate(data.columns)}
+    return values[0], values[1], col_index, data.index[-1]
+
 
 class StrategyInterface(ABC):
-    """Interface for all trading strategies."""
+    """Interface for all trading strategies.
+    
+    Strategy metadata lives on the class so it can be read without
+    constructing an instance.
+    """
+    
+    NAME: str = ''
+    DESCRIPTION: str = ''
+    DEFAULT_PARAMS: Dict[str, Any] = {}
+    
+    # Columns read by execute_tail, resolved once by bind
+    REQUIRED: Tuple[str, ...] = ('close',)
     
     def __init__(self, params: Dict[str, Any] = None):
         """Initialize the strategy.
         
         Args:
-            params: Strategy parameters
+            params: Strategy parameters; missing keys take the defaults
+        """
+        self.params = {**self.DEFAULT_PARAMS, **(params or {})}
+        self._columns: Optional[List[str]] = None
+        self._idx: Optional[Dict[str, int]] = None
+    
+    def required_columns(self) -> List[str]:
+        """Get the columns the strategy reads.
+        
+        Returns:
+            List of column names
+        """
+        return list(self.REQUIRED)
+    
+    def bind(self, columns: List[str]) -> None:
+        """Resolve the positions of the required columns in a data stream.
+        
+        Called once when the strategy is attached to the stream, so the hot
+        path only does integer indexing and no per-bar column checks.
+        
+        Args:
+            columns: Column names of the rows passed to execute_tail
+        
+        Raises:
+            ValueError: If the stream lacks a required column
+        """
+        columns = list(columns)
+        missing = [name for name in self.required_columns() if name not in columns]
+        if missing:
+            raise ValueError(f"{self.get_name()} requires missing columns: {', '.join(missing)}")
+        
+        self._columns = columns
+        self._idx = {name: columns.index(name) for name in self.required_columns()}
+    
+    def _column_index(self, col_index: Optional[Dict[str, int]]) -> Dict[str, int]:
+        """Get the column positions to use for execute_tail.
+        
+        Args:
+            col_index: Positions passed by the caller, if any
+        
+        Returns:
+            col_index, or the positions resolved by bind
+        
+        Raises:
+            ValueError: If no positions were passed and the strategy is not bound
         """
-        self.params = params or {}
+        if col_index is not None:
+            return col_index
+        if self._idx is None:
+            raise ValueError(f"{self.get_name()} is not bound to a data stream")
+        return self._idx
     
     @abstractmethod
     def execute(self, data: pd.DataFrame) -> Optional[Dict[str, Any]]:
@@ -30,31 +128,77 @@ class StrategyInterface(ABC):
         pass
     
     @abstractmethod
-    def get_name(self) -> str:
+    def execute_tail(self, prev: np.ndarray, last: np.ndarray,
+                     col_index: Optional[Dict[str, int]] = None,
+                     timestamp: Any = None) -> Optional[Dict[str, Any]]:
+        """Execute the strategy on the last two rows of the data.
+        
+        The caller slices the frame once (see ``frame_tail``) so the signal
+        check is plain integer indexing into small ndarrays.
+        
+        Args:
+            prev: Second to last row values
+            last: Last row values
+            col_index: Mapping of column name to position in the rows;
+                defaults to the positions resolved by `bind`
+            timestamp: Timestamp of the last row
+        
+        Returns:
+            Signal dictionary or None if no signal
+        """
+        pass
+    
+    def generate_signals(self, data: Union[pd.DataFrame, PriceView]) -> np.ndarray:
+        """Generate the signal for every row of the data in one pass.
+        
+        The default walks the rows through ``execute_tail``; strategies
+        override it with a vectorized version.
+        
+        Args:
+            data: DataFrame or PriceView with price data and indicators
+        
+        Returns:
+            int8 array of length len(data): 1 buy, -1 sell, 0 no signal
+        """
+        if isinstance(data, pd.DataFrame):
+            data = PriceView.from_frame(data)
+        
+        signals = np.zeros(len(data), dtype=np.int8)
+        values = np.column_stack([data[name] for name in data.columns])
+        col_index = {name: i for i, name in enumerate(data.columns)}
+        timestamps = pd.to_datetime(data.timestamps, unit='ms')
+        for i in range(1, len(values)):
+            signal = self.execute_tail(values[i - 1], values[i], col_index, timestamps[i])
+            if signal:
+                signals[i] = SIGNAL_CODES[signal['action']]
+        return signals
+    
+    @classmethod
+    def get_name(cls) -> str:
         """Get the name of the strategy.
         
         Returns:
             Strategy name
         """
-        pass
+        return cls.NAME
     
-    @abstractmethod
-    def get_description(self) -> str:
+    @classmethod
+    def get_description(cls) -> str:
         """Get the description of the strategy.
         
         Returns:
             Strategy description
         """
-        pass
+        return cls.DESCRIPTION
     
-    @abstractmethod
-    def get_default_params(self) -> Dict[str, Any]:
+    @classmethod
+    def get_default_params(cls) -> Dict[str, Any]:
         """Get the default parameters for the strategy.
         
         Returns:
             Dictionary of default parameters
         """
-        pass
+        return dict(cls.DEFAULT_PARAMS)
     
     def set_params(self, params: Dict[str, Any]) -> None:
         """Set strategy parameters.
@@ -63,6 +207,10 @@ class StrategyInterface(ABC):
             params: Strategy parameters
         """
         self.params.update(params)
+        
+        # Parameters may change the required columns
+        if self._columns is not None:
+            self.bind(self._columns)
     
     def get_params(self) -> Dict[str, Any]:
         """Get current strategy parameters.
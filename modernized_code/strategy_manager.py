@@ -4,6 +4,7 @@ from typing import Dict, Any, Optional, Type, List
 
 from strategy_interface import StrategyInterface
 from strategies import AVAILABLE_STRATEGIES
+from _indicator_jit import COLUMNS
 from utils.logger import get_logger
 
 
@@ -16,14 +17,18 @@ class StrategyManager:
         self.strategies = {}
         self.strategy_params = {}
     
-    def create_strategy(self, strategy_name: str) -> Optional[StrategyInterface]:
-        """Create a strategy instance.
+    def create_strategy(self, strategy_name: str,
+                        columns: Optional[List[str]] = None) -> Optional[StrategyInterface]:
+        """Create a strategy instance bound to a data stream.
         
         Args:
             strategy_name: Name of the strategy to create
+            columns: Column names of the data stream; defaults to the
+                DataProcessor columns
         
         Returns:
-            Strategy instance or None if strategy not found
+            Strategy instance or None if strategy not found or the stream
+            lacks a column it requires
         """
         if strategy_name not in AVAILABLE_STRATEGIES:
             self.logger.error(f"Strategy not found: {strategy_name}")
@@ -38,10 +43,17 @@ class StrategyManager:
         # Create strategy instance
         strategy = strategy_class(params)
         
+        # Resolve the column positions once instead of checking them per bar
+        try:
+            strategy.bind(list(COLUMNS) if columns is None else columns)
+        except ValueError as e:
+            self.logger.error(f"Cannot use strategy {strategy_name}: {e}")
+            return None
+        
         # Store strategy instance
         self.strategies[strategy_name] = strategy
         
-        self.logger.info(f"Created strategy: {strategy_name}")
+        self.logger.info("Created strategy: %s", strategy_name)
         return strategy
     
     def get_strategy(self, strategy_name: str) -> Optional[StrategyInterface]:
@@ -73,9 +85,14 @@ class StrategyManager:
         
         # Update existing strategy instance if it exists
         if strategy_name in self.strategies:
-            self.strategies[strategy_name].set_params(params)
-        
-        self.logger.info(f"Configured strategy {strategy_name} with params: {params}")
+            try:
+                self.strategies[strategy_name].set_params(params)
+            except ValueError as e:
+                self.logger.error(f"Cannot use strategy {strategy_name}: {e}")
+                del self.strategies[strategy_name]
+                return
+        
+        self.logger.info("Configured strategy %s with params: %s", strategy_name, params)
     
     def get_available_strategies(self) -> List[str]:
         """Get list of available strategies.
@@ -98,12 +115,12 @@ class StrategyManager:
             self.logger.error(f"Strategy not found: {strategy_name}")
             return {}
         
-        # Create temporary instance to get info
-        temp_strategy = AVAILABLE_STRATEGIES[strategy_name]()
+        # Metadata is stored on the class, no instance needed
+        strategy_class = AVAILABLE_STRATEGIES[strategy_name]
         
         return {
-            'name': temp_strategy.get_name(),
-            'description': temp_strategy.get_description(),
-            'default_params': temp_strategy.get_default_params(),
+            'name': strategy_class.NAME,
+            'description': strategy_class.DESCRIPTION,
+            'default_params': strategy_class.get_default_params(),
             'current_params': self.strategy_params.get(strategy_name, {})
         }
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import _indicator_jit as ij
+from indicators import (IndicatorState, _vectorized_update, calculate_indicators,
+                        calculate_indicators_batch, clear_indicator_cache)
+
+
+# Relative tolerance between the streamed and the bulk indicators; only the
+# rounding of the sliding-window sums separates them
+STREAM_RTOL = 1e-8
+
+
+def _btc_frame(n: int, seed: int = 0) -> pd.DataFrame:
+    """Random-walk 1m candles at BTC price levels, rounded to the tick size.
+    
+    Args:
+        n: Number of candles
+        seed: Random seed
+    
+    Returns:
+        DataFrame with OHLCV columns indexed by open time
+    """
+    rng = np.random.default_rng(seed)
+    close = np.round(60000.0 * np.exp(np.cumsum(rng.normal(0.0, 1e-3, n))), 2)
+    high = np.round(close * (1.0 + np.abs(rng.normal(0.0, 5e-4, n))), 2)
+    low = np.round(close * (1.0 - np.abs(rng.normal(0.0, 5e-4, n))), 2)
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    volume = np.round(rng.uniform(1.0, 100.0, n), 3)
+    return pd.DataFrame({'open': open_, 'high': high, 'low': low, 'close': close,
+                         'volume': volume},
+                        index=pd.date_range('2024-01-01', periods=n, freq='min'))
+
+
+def _reference_indicators(data: pd.DataFrame) -> pd.DataFrame:
+    """Indicators from the vectorized per-indicator functions alone.
+    
+    Args:
+        data: DataFrame with OHLCV columns
+    
+    Returns:
+        DataFrame with the buffer columns
+    """
+    buf = np.empty((ij.N_FIELDS, len(data)))
+    for i, column in enumerate(ij.COLUMNS[:ij.VOLUME + 1]):
+        buf[i] = data[column].to_numpy()
+    _vectorized_update(buf, np.zeros(ij.N_STATE))
+    return pd.DataFrame(buf[:len(ij.COLUMNS)].T, columns=list(ij.COLUMNS), index=data.index)
+
+
+class TestIndicatorState(unittest.TestCase):
+    """The realtime ring buffer must reproduce calculate_indicators."""
+    
+    def test_streamed_candles_match_bulk_calculation(self):
+        data = _btc_frame(2500)
+        state = IndicatorState.from_frame(data.iloc[:500], capacity=500)
+        rows = [state.update(*candle) for candle in
+                data.iloc[500:].itertuples(index=False, name=None)]
+        streamed = pd.DataFrame(rows, index=data.index[500:])
+        expected = calculate_indicators(data).iloc[500:]
+        
+        for column in ij.COLUMNS:
+            with self.subTest(column=column):
+                np.testing.assert_allclose(streamed[column].to_numpy(),
+                                           expected[column].to_numpy(),
+                                           rtol=STREAM_RTOL, atol=0.0)
+    
+    def test_ring_keeps_prices_exact(self):
+        data = _btc_frame(300)
+        state = IndicatorState.from_frame(data)
+        order = state.positions(state.count)
+        for i, column in enumerate(('open', 'high', 'low', 'close', 'volume')):
+            with self.subTest(column=column):
+                np.testing.assert_array_equal(state.buf[i, order],
+                                              data[column].to_numpy()[-state.count:])
+
+
+class TestMissingPrices(unittest.TestCase):
+    """A NaN price only affects the candles whose windows contain it."""
+    
+    def setUp(self):
+        clear_indicator_cache()
+        self.data = _btc_frame(400)
+        self.data.iloc[100, self.data.columns.get_loc('close')] = np.nan
+        self.expected = _reference_indicators(self.data)
+    
+    def assertMatchesReference(self, result: pd.DataFrame):
+        for column in ij.COLUMNS:
+            with self.subTest(column=column):
+                np.testing.assert_allclose(result[column].to_numpy(),
+                                           self.expected[column].to_numpy(),
+                                           rtol=STREAM_RTOL, atol=0.0)
+        # The moving averages recover once the NaN leaves their windows
+        self.assertFalse(result['sma_200'].iloc[300:].isna().any())
+        self.assertFalse(result['ema_26'].iloc[101:].isna().any())
+    
+    def test_calculate_indicators(self):
+        self.assertMatchesReference(calculate_indicators(self.data))
+    
+    def test_calculate_indicators_batch(self):
+        clean = _btc_frame(400, seed=1)
+        results = calculate_indicators_batch([clean, self.data, clean])
+        self.assertMatchesReference(results[1])
+        for result in (results[0], results[2]):
+            np.testing.assert_allclose(result[list(ij.COLUMNS)].to_numpy(),
+                                       calculate_indicators(clean)[list(ij.COLUMNS)].to_numpy(),
+                                       rtol=STREAM_RTOL, atol=0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
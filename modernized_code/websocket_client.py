@@ -1,123 +1,750 @@
 #!/usr/bin/env python3
 
+import asyncio
+import collections
+import inspect
+import itertools
 import json
+import random
+import socket
 import threading
 import time
-from typing import Dict, Any, Callable, Optional
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple, Union
 
-import websocket
+import numpy as np
+import websockets
 
 from utils.logger import get_logger
 
+# Fastest available JSON decoder; all accept str or bytes and raise ValueError
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    try:
+        import ujson
+        _loads = ujson.loads
+    except ImportError:
+        _loads = json.loads
+    
+    def _dumps(data: Any) -> bytes:
+        """Encode data as compact UTF-8 JSON, like orjson.dumps."""
+        return json.dumps(data, separators=(',', ':')).encode()
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+if msgspec is not None:
+    # The structs only hold scalars and other structs, so they cannot form
+    # reference cycles: gc=False keeps them out of the cyclic garbage
+    # collector, and frozen=True lets them be shared safely between callbacks.
+    # Stream klines are JSON objects, not arrays, so the structs cannot be
+    # array_like; prices are parsed from their strings straight into the
+    # float fields, without an intermediate str object.
+    class Kline(msgspec.Struct, frozen=True, gc=False):
+        """Kline fields used by the bot; other fields are skipped when decoding."""
+        t: int
+        o: float
+        h: float
+        l: float
+        c: float
+        v: float
+        x: bool
+    
+    class KlineMessage(msgspec.Struct, frozen=True, gc=False):
+        """Binance kline stream message."""
+        s: str
+        k: Kline
+    
+    class StreamMessage(msgspec.Struct, frozen=True, gc=False):
+        """Combined stream envelope around a kline message."""
+        stream: str
+        data: KlineMessage
+    
+    # strict=False converts the string-encoded prices to floats while decoding
+    _stream_decoder = msgspec.json.Decoder(StreamMessage, strict=False)
+
+
+def _decode(message) -> Tuple[Optional[str], Any]:
+    """Decode a WebSocket message from a combined stream connection.
+    
+    Stream messages are unwrapped from their {"stream", "data"} envelope.
+    Kline messages are decoded into a KlineMessage struct when msgspec is
+    installed; anything else is decoded into a dict. All clients decode on
+    the shared loop thread, so parses never contend for the GIL with each
+    other; only the dispatch threads run alongside, outside the parser.
+    
+    Args:
+        message: Raw message as str or bytes
+    
+    Returns:
+        Tuple of (stream name, or None for control responses; message)
+    
+    Raises:
+        ValueError: If the message is not valid JSON
+    """
+    if msgspec is not None:
+        try:
+            envelope = _stream_decoder.decode(message)
+            return envelope.stream, envelope.data
+        except msgspec.ValidationError:
+            pass
+    
+    data = _loads(message)
+    if isinstance(data, dict) and 'stream' in data and 'data' in data:
+        return data['stream'], data['data']
+    return None, data
+
+
+def _kline_closed(data: Any) -> bool:
+    """Check whether a decoded stream message holds a closed kline.
+    
+    Args:
+        data: KlineMessage struct or dict
+    
+    Returns:
+        True if the message is a kline message with its closed flag set
+    """
+    kline = getattr(data, 'k', None)
+    if kline is not None:
+        return kline.x
+    kline = data.get('k') if isinstance(data, dict) else None
+    return bool(kline and kline.get('x'))
+
+
+def _new_ring() -> Tuple[np.ndarray, np.ndarray]:
+    """Allocate the kline ring buffer of one stream.
+    
+    Returns:
+        Tuple of (array of KLINE_HISTORY rows of KLINE_COLUMNS, one-element
+        count of the klines written)
+    """
+    return (np.zeros((KLINE_HISTORY, len(KLINE_COLUMNS)), dtype=np.float64),
+            np.zeros(1, dtype=np.int64))
+
+
+def _ignore(data: Any) -> None:
+    """Default message handler: discard the message."""
+
+
+def stream_name(symbol: str) -> str:
+    """Get the kline stream name of a symbol.
+    
+    Args:
+        symbol: Trading pair symbol (e.g., 'BTC/USDT' or 'btcusdt')
+    
+    Returns:
+        Stream name (e.g., 'btcusdt@kline_1m')
+    """
+    return f"{symbol.replace('/', '').lower()}@kline_1m"
+
+
+STREAM_BASE_URL = "wss://stream.binance.com:9443"
+
+# Reconnection backoff: capped exponential delays with decorrelated jitter
+RECONNECT_BASE_DELAY = 1.0
+RECONNECT_MAX_DELAY = 30.0
+RECONNECT_MAX_RETRIES = 20
+
+# Keepalive pings; a connection that misses a pong is closed and reconnected
+PING_INTERVAL = 20.0
+PING_TIMEOUT = 10.0
+
+# Socket receive buffer requested for stream connections, so bursts of
+# frames stay queued in the kernel while the loop is busy
+SOCKET_RCVBUF = 1 << 20
+
+# Idle seconds before TCP keepalive probes start, so a half-open connection
+# is noticed by the kernel even while pings are in flight
+TCP_KEEPALIVE_IDLE = 30
+
+# Messages waiting for the on_message callback; the oldest are dropped when
+# the callback falls this far behind
+DISPATCH_QUEUE_SIZE = 4096
+
+# Closed klines kept per symbol, and the columns of their rows
+KLINE_HISTORY = 1000
+KLINE_COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+# Maximum number of serialized control messages kept by a client
+SEND_CACHE_SIZE = 256
+
+# Keys of a Binance control message (SUBSCRIBE, LIST_SUBSCRIPTIONS, ...)
+_CONTROL_KEYS = frozenset(('method', 'params', 'id'))
+
+# Closed flag of a kline that is still open, as serialized by Binance
+_OPEN_KLINE = b'"x":false'
+
+# Control methods taking any number of streams in one request
+_STREAM_METHODS = frozenset(('SUBSCRIBE', 'UNSUBSCRIBE'))
+
+# Event loop shared by all clients. Every connection is a task on it, so any
+# number of streams is served by one thread with epoll-driven I/O.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared event loop, starting its thread on first use.
+    
+    Returns:
+        Running event loop
+    """
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(target=_loop.run_forever,
+                                            name='websocket-loop', daemon=True)
+            _loop_thread.start()
+        return _loop
+
+
+@dataclass
+class _Connection:
+    """State of one connection task.
+    
+    Every connect() starts a task with a fresh instance, so a task that is
+    still finishing after a disconnect cannot touch the state of its
+    successor.
+    
+    Attributes:
+        stop: Set on the loop to stop the task
+        stopped: Set by the task once it has stopped
+        ws: Open connection of the task, if any
+        backoff: True while the task waits to reconnect
+    """
+    
+    stop: asyncio.Event = field(default_factory=asyncio.Event)
+    stopped: threading.Event = field(default_factory=threading.Event)
+    ws: Any = None
+    backoff: bool = False
+
 
 class WebSocketClient:
-    """Client for handling WebSocket connections to Binance."""
+    """Client for handling WebSocket connections to Binance.
     
-    def __init__(self):
-        """Initialize the WebSocket client."""
+    All symbols of a client share one combined stream connection, which runs
+    as an asyncio task on a loop shared by all clients. Decoded
+    messages are queued for a per-client dispatch thread that calls the
+    callback registered for the message's symbol and on_message, so a slow
+    callback never stalls reading; coroutine on_message callbacks are
+    awaited on the loop instead. The other callbacks run on the loop.
+    """
+    
+    def __init__(self, closed_only: bool = False):
+        """Initialize the WebSocket client.
+        
+        Args:
+            closed_only: Only pass on klines once closed; updates of the
+                open kline are dropped before they are decoded
+        """
         self.logger = get_logger()
         self.ws = None
-        self.thread = None
+        self.closed_only = closed_only
+        self.task: Optional[Future] = None
         self.running = False
-        self.on_message: Optional[Callable[[Dict[str, Any]], None]] = None
+        self.on_message = None
         self.on_error: Optional[Callable[[Exception], None]] = None
         self.on_close: Optional[Callable[[], None]] = None
         self.on_open: Optional[Callable[[], None]] = None
+        
+        # Streams of the current connection
+        self.streams: List[str] = []
+        
+        # Ring buffer of closed klines per stream (see _new_ring). The dict is
+        # replaced rather than modified, so the loop thread reads it unlocked
+        self._rings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        
+        self._loop = _get_loop()
+        
+        # State of the current connection task; self.ws mirrors its ws
+        self._conn: Optional[_Connection] = None
+        self._last_msg_ts = 0.0
+        
+        # Serialized control messages, keyed by (method, params, id)
+        self._send_cache: Dict[tuple, bytes] = {}
+        
+        # Messages buffered by cork(), and ids for merged requests
+        self._pending: Optional[List[Dict[str, Any]]] = None
+        self._request_ids = itertools.count(1)
+        
+        # Ids of the requests sent by _switch_streams, whose replies are
+        # consumed here rather than passed to the callbacks
+        self._switch_ids: set = set()
+        
+        # Per-symbol callbacks, keyed by stream name
+        self._handlers: Dict[str, Callable[[Any], None]] = {}
+        
+        # (stream, message) pairs for the dispatch thread; the semaphore
+        # counts appends, so it may run ahead of the queue after drops
+        self._queue: collections.deque = collections.deque(maxlen=DISPATCH_QUEUE_SIZE)
+        self._queue_ready = threading.Semaphore(0)
+        self._dispatcher: Optional[threading.Thread] = None
+        self._dispatching = False
+        self.dropped_messages = 0
+    
+    @property
+    def on_message(self) -> Optional[Callable[[Any], Any]]:
+        """Callback for decoded messages, a function or a coroutine function."""
+        return self._on_message_callback
     
-    def connect(self, symbol: str) -> None:
-        """Connect to Binance WebSocket for a symbol.
+    @on_message.setter
+    def on_message(self, callback: Optional[Callable[[Any], Any]]) -> None:
+        """Bind the message callback.
+        
+        The callback is classified once here, so the per-message path calls
+        the bound handler without any checks.
+        
+        Args:
+            callback: Function or coroutine function, or None to discard messages
+        """
+        self._on_message_callback = callback
+        if inspect.iscoroutinefunction(callback):
+            self._dispatch = _ignore
+            self._dispatch_async = callback
+        else:
+            self._dispatch = callback or _ignore
+            self._dispatch_async = None
+    
+    def register(self, symbol: str, callback: Callable[[Any], None]) -> None:
+        """Register a callback for the messages of one symbol.
+        
+        The callback is called on the dispatch thread for each message of
+        the symbol's stream, before on_message. Registering again replaces
+        the previous callback.
         
         Args:
             symbol: Trading pair symbol (e.g., 'BTC/USDT')
+            callback: Function called with each decoded message
         """
+        self._handlers[stream_name(symbol)] = callback
+    
+    def unregister(self, symbol: str) -> None:
+        """Remove the callback registered for a symbol, if any.
+        
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTC/USDT')
+        """
+        self._handlers.pop(stream_name(symbol), None)
+    
+    def connect(self, symbols: Union[str, List[str]]) -> None:
+        """Connect to Binance WebSocket for one or more symbols.
+        
+        Every symbol's kline stream is multiplexed onto one connection. If
+        the client is already connected, the connection is kept and only its
+        streams are changed.
+        
+        Args:
+            symbols: Trading pair symbol or list of symbols (e.g., 'BTC/USDT')
+        
+        Raises:
+            ValueError: If no symbol is given
+        """
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        if not symbols:
+            raise ValueError("At least one symbol is required")
+        
         # Convert from CCXT format if needed
-        if '/' in symbol:
-            symbol = symbol.replace('/', '').lower()
+        streams = list(dict.fromkeys(stream_name(symbol) for symbol in symbols))
+        
+        # An open connection switches streams with SUBSCRIBE/UNSUBSCRIBE
+        # requests, which saves the TCP and TLS handshakes of a new one
+        if self.task and self.ws is not None:
+            self._switch_streams(streams)
+            return
         
         # Disconnect if already connected
-        if self.ws:
+        if self.task:
             self.disconnect()
         
-        # Create WebSocket connection
-        url = f"wss://stream.binance.com:9443/ws/{symbol}@kline_1m"
-        self.ws = websocket.WebSocketApp(
-            url,
-            on_message=self._on_message,
-            on_error=self._on_error,
-            on_close=self._on_close,
-            on_open=self._on_open
-        )
-        
-        # Start WebSocket in a separate thread
+        # Start the dispatch thread, then the connection as a task on the
+        # shared event loop
+        self._queue.clear()
+        self._queue_ready = threading.Semaphore(0)
+        self._dispatching = True
+        self._dispatcher = threading.Thread(target=self._dispatch_loop,
+                                            name='websocket-dispatch', daemon=True)
+        self._dispatcher.start()
+        
+        # Klines and pending replies of the previous connection are discarded
+        self._rings = {}
+        self._switch_ids.clear()
+        self._set_streams(streams)
+        
         self.running = True
-        self.thread = threading.Thread(target=self._run_forever)
-        self.thread.daemon = True
-        self.thread.start()
+        self._conn = _Connection()
+        self.task = asyncio.run_coroutine_threadsafe(self._run(self._conn), self._loop)
+        
+        self.logger.info(f"Connected to WebSocket for {', '.join(self.streams)}")
+    
+    def _switch_streams(self, streams: List[str]) -> None:
+        """Change the streams of the open connection.
+        
+        Klines already received for the streams that are kept stay buffered.
+        
+        Args:
+            streams: Stream names to receive from now on
+        """
+        removed = [stream for stream in self.streams if stream not in streams]
+        added = [stream for stream in streams if stream not in self.streams]
+        self._set_streams(streams)
+        
+        messages = []
+        if removed:
+            messages.append({'method': 'UNSUBSCRIBE', 'params': removed,
+                             'id': next(self._request_ids)})
+        if added:
+            messages.append({'method': 'SUBSCRIBE', 'params': added,
+                             'id': next(self._request_ids)})
+        self._switch_ids.update(data['id'] for data in messages)
+        self.send_many(messages)
         
-        self.logger.info(f"Connected to WebSocket for {symbol}")
+        self.logger.info(f"Switched WebSocket to {', '.join(self.streams)}")
+    
+    def _set_streams(self, streams: List[str]) -> None:
+        """Set the streams of the connection, with a kline ring buffer each.
+        
+        Reconnections use the new streams.
+        
+        Args:
+            streams: Stream names
+        """
+        rings = self._rings
+        self._rings = {stream: rings.get(stream) or _new_ring() for stream in streams}
+        self.streams = streams
+    
+    def _stream_url(self) -> str:
+        """Get the combined stream URL of the current streams.
+        
+        Returns:
+            Stream URL
+        """
+        return f"{STREAM_BASE_URL}/stream?streams={'/'.join(self.streams)}"
     
     def disconnect(self) -> None:
         """Disconnect from WebSocket."""
         self.running = False
-        if self.ws:
-            self.ws.close()
+        task = self.task
+        if task:
+            conn = self._conn
+            self._loop.call_soon_threadsafe(self._request_stop, task, conn)
+            
+            # Wait for the task to stop unless called from a callback on the
+            # loop. A close handshake with an unresponsive server can take
+            # websockets' full close timeout, so the wait is bounded to keep
+            # the calling (UI) thread responsive; the task is then cancelled,
+            # and as it only touches its own state it cannot affect the next
+            # connection while it finishes.
+            if threading.current_thread() is not _loop_thread:
+                if not conn.stopped.wait(timeout=1.0):
+                    task.cancel()
+            self.task = None
+            self._conn = None
             self.ws = None
         
-        if self.thread:
-            self.thread.join(timeout=1.0)
-            self.thread = None
+        if self._dispatcher:
+            # Messages still queued are discarded
+            self._dispatching = False
+            self._queue_ready.release()
+            if threading.current_thread() is not self._dispatcher:
+                self._dispatcher.join(timeout=1.0)
+            self._dispatcher = None
         
         self.logger.info("Disconnected from WebSocket")
     
-    def _run_forever(self) -> None:
-        """Run WebSocket connection in a loop."""
+    def _request_stop(self, task: Future, conn: _Connection) -> None:
+        """Stop a connection task; runs on the loop, so its state is stable.
+        
+        Args:
+            task: Connection task
+            conn: State of the task
+        """
+        # Setting the event ends a wait to reconnect at once; an open
+        # connection is closed cleanly, which ends its read loop, and only a
+        # connection attempt still in progress is cancelled
+        conn.stop.set()
+        if conn.ws is not None:
+            self._loop.create_task(conn.ws.close())
+        elif not conn.backoff:
+            task.cancel()
+    
+    async def _run(self, conn: _Connection) -> None:
+        """Run WebSocket connection in a loop until stopped.
+        
+        Each attempt connects to the URL of the streams current at the time.
+        The client's ws attribute is only updated while conn is the current
+        connection.
+        
+        Args:
+            conn: State of this task
+        """
+        stop = conn.stop
         retry_count = 0
-        max_retries = 5
+        max_retries = RECONNECT_MAX_RETRIES
+        delay = RECONNECT_BASE_DELAY
         
-        while self.running and retry_count < max_retries:
-            try:
-                self.ws.run_forever()
+        try:
+            while not stop.is_set() and retry_count < max_retries:
+                ws = None
+                connected_at = time.monotonic()
+                try:
+                    async with websockets.connect(self._stream_url(), compression='deflate',
+                                                  max_size=2 ** 20,
+                                                  ping_interval=PING_INTERVAL,
+                                                  ping_timeout=PING_TIMEOUT) as ws:
+                        conn.ws = ws
+                        if conn is self._conn:
+                            self.ws = ws
+                        self._tune_socket(ws)
+                        self._on_open()
+                        
+                        # Frames are passed on as raw bytes: the decoders
+                        # parse UTF-8 directly, so decoding to str first
+                        # would only add a pass over every message
+                        while True:
+                            try:
+                                message = await ws.recv(decode=False)
+                            except websockets.ConnectionClosedOK:
+                                break
+                            await self._on_message(message)
+                
+                except Exception as e:
+                    self._on_error(e)
+                
+                finally:
+                    conn.ws = None
+                    if conn is self._conn:
+                        self.ws = None
+                    if ws is not None:
+                        self._on_close(ws.close_code, ws.close_reason)
+                
+                # A connection that delivered messages was healthy; only
+                # consecutive failures count towards the retry limit
+                if self._last_msg_ts >= connected_at:
+                    retry_count = 0
+                    delay = RECONNECT_BASE_DELAY
                 
                 # If we get here, the connection was closed
-                if self.running:
-                    self.logger.warning("WebSocket connection closed, reconnecting...")
-                    time.sleep(1)  # Wait before reconnecting
+                if not stop.is_set():
+                    delay = min(RECONNECT_MAX_DELAY,
+                                random.uniform(RECONNECT_BASE_DELAY, delay * 3.0))
+                    self.logger.warning(f"WebSocket connection closed, reconnecting in {delay:.1f}s...")
+                    
+                    # Wait before reconnecting, unless stopped meanwhile
+                    conn.backoff = True
+                    try:
+                        await asyncio.wait_for(stop.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    finally:
+                        conn.backoff = False
                     retry_count += 1
-                else:
-                    break
             
-            except Exception as e:
-                self.logger.error(f"WebSocket error: {e}")
-                time.sleep(1)  # Wait before reconnecting
-                retry_count += 1
+            if retry_count >= max_retries:
+                self.logger.error("Max WebSocket reconnection attempts reached")
         
-        if retry_count >= max_retries:
-            self.logger.error("Max WebSocket reconnection attempts reached")
+        finally:
+            conn.stopped.set()
     
-    def _on_message(self, ws, message) -> None:
-        """Handle WebSocket messages.
+    def _tune_socket(self, ws) -> None:
+        """Set low-latency options on a new connection's socket.
+        
+        Disables Nagle's algorithm and delayed ACKs (Linux), enables TCP
+        keepalive and raises the receive buffer, which is only ever
+        enlarged. Failures are ignored: the connection works the same, just
+        with the system defaults.
         
         Args:
-            ws: WebSocket instance
-            message: Message received
+            ws: Open connection
         """
+        sock = ws.transport.get_extra_info('socket')
+        if sock is None:
+            return
+        
+        options = [
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        # Linux only
+        if hasattr(socket, 'TCP_QUICKACK'):
+            options.append((socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1))
+        if hasattr(socket, 'TCP_KEEPIDLE'):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, TCP_KEEPALIVE_IDLE))
+        
+        for level, option, value in options:
+            try:
+                sock.setsockopt(level, option, value)
+            except OSError as e:
+                self.logger.debug(f"Could not set WebSocket socket option {option}: {e}")
+        
         try:
-            data = json.loads(message)
-            
-            # Call user-defined callback if set
-            if self.on_message:
-                self.on_message(data)
+            if sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) < SOCKET_RCVBUF:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RCVBUF)
+        except OSError as e:
+            self.logger.debug(f"Could not set WebSocket receive buffer: {e}")
+    
+    async def _on_message(self, message) -> None:
+        """Handle WebSocket messages.
+        
+        Stream messages are passed on without their combined stream
+        envelope; the symbol is in the message itself.
         
-        except json.JSONDecodeError as e:
+        Args:
+            message: Message received, as UTF-8 bytes
+        """
+        if self.closed_only and _OPEN_KLINE in message:
+            # Most frames update the open kline; skip them with a byte scan
+            # instead of a full decode (frames the scan misses are checked
+            # after decoding)
+            self._last_msg_ts = time.monotonic()
+            return
+        
+        try:
+            stream, data = _decode(message)
+        except ValueError as e:
             self.logger.error(f"Failed to parse WebSocket message: {e}")
-        except Exception as e:
-            self.logger.error(f"Error handling WebSocket message: {e}")
+            return
+        self._last_msg_ts = time.monotonic()
+        
+        if stream is not None:
+            # Frames of a stream just switched away from keep arriving until
+            # the UNSUBSCRIBE takes effect; they must not reach the callbacks
+            if stream not in self._rings:
+                return
+            self._record_kline(stream, data)
+            if self.closed_only and not _kline_closed(data):
+                return
+        elif isinstance(data, dict) and data.get('id') in self._switch_ids:
+            # Reply to a stream switch
+            self._switch_ids.discard(data['id'])
+            if data.get('error'):
+                self.logger.error(f"WebSocket stream switch failed: {data['error']}")
+            return
+        
+        if self._dispatch_async is not None:
+            # Coroutine callbacks cooperate with the loop, so await them here
+            try:
+                await self._dispatch_async(data)
+            except Exception as e:
+                self.logger.error(f"Error handling WebSocket message: {e}")
+        
+        if self._dispatch is _ignore and not self._handlers:
+            return
+        
+        # Hand the message to the dispatch thread; a full queue drops its oldest
+        if len(self._queue) == self._queue.maxlen:
+            self.dropped_messages += 1
+            if self.dropped_messages % self._queue.maxlen == 1:
+                self.logger.warning(f"WebSocket callback is falling behind, "
+                                    f"{self.dropped_messages} messages dropped")
+        self._queue.append((stream, data))
+        self._queue_ready.release()
+    
+    def _record_kline(self, stream: str, data: Any) -> None:
+        """Append a closed kline to the ring buffer of its stream.
+        
+        Args:
+            stream: Stream name of the message
+            data: Decoded stream message
+        """
+        entry = self._rings.get(stream)
+        if entry is None:
+            return
+        
+        kline = getattr(data, 'k', None)
+        if kline is not None:
+            if not kline.x:
+                return
+            row = (kline.t, kline.o, kline.h, kline.l, kline.c, kline.v)
+        else:
+            kline = data.get('k') if isinstance(data, dict) else None
+            if not kline or not kline['x']:
+                return
+            # numpy parses the string-encoded prices on assignment
+            row = (kline['t'], kline['o'], kline['h'], kline['l'], kline['c'], kline['v'])
+        
+        ring, count = entry
+        head = count[0]
+        
+        # A kline repeated after a reconnect is already stored
+        if head and ring[(head - 1) % KLINE_HISTORY, 0] == row[0]:
+            return
+        
+        ring[head % KLINE_HISTORY] = row
+        count[0] = head + 1
+    
+    def get_klines(self, symbol: str) -> np.ndarray:
+        """Get the closed klines received for a symbol.
+        
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTC/USDT')
+        
+        Returns:
+            Array of shape (n, len(KLINE_COLUMNS)), oldest kline first, with
+            at most KLINE_HISTORY rows
+        
+        Raises:
+            ValueError: If the client is not streaming the symbol
+        """
+        entry = self._rings.get(stream_name(symbol))
+        if entry is None:
+            raise ValueError(f"Not streaming {symbol}")
+        
+        # Copy, as the loop thread keeps writing to the ring
+        ring, count = entry
+        head = int(count[0])
+        if head <= KLINE_HISTORY:
+            return ring[:head].copy()
+        return np.roll(ring, -(head % KLINE_HISTORY), axis=0)
     
-    def _on_error(self, ws, error) -> None:
+    def _dispatch_loop(self) -> None:
+        """Call the callbacks for queued messages until disconnected."""
+        queue = self._queue
+        ready = self._queue_ready
+        handlers = self._handlers
+        while True:
+            ready.acquire()
+            # A new connect() replaces the semaphore, so a dispatcher that
+            # outlived its disconnect() exits instead of joining the new one
+            if not self._dispatching or ready is not self._queue_ready:
+                return
+            
+            try:
+                stream, data = queue.popleft()
+            except IndexError:
+                # The message was dropped while the queue was full
+                continue
+            
+            # Queued before its stream was switched away from
+            if stream is not None and stream not in self._rings:
+                continue
+            
+            try:
+                # Symbol callback, found with one dict lookup
+                handler = handlers.get(stream)
+                if handler is not None:
+                    handler(data)
+                
+                # User-defined callback, or _ignore if it was unset meanwhile
+                self._dispatch(data)
+            
+            except Exception as e:
+                self.logger.error(f"Error handling WebSocket message: {e}")
+    
+    def _on_error(self, error) -> None:
         """Handle WebSocket errors.
         
         Args:
-            ws: WebSocket instance
             error: Error received
         """
         self.logger.error(f"WebSocket error: {error}")
@@ -126,11 +753,10 @@ class WebSocketClient:
         if self.on_error:
             self.on_error(error)
     
-    def _on_close(self, ws, close_status_code, close_msg) -> None:
+    def _on_close(self, close_status_code, close_msg) -> None:
         """Handle WebSocket connection close.
         
         Args:
-            ws: WebSocket instance
             close_status_code: Close status code
             close_msg: Close message
         """
@@ -140,12 +766,8 @@ class WebSocketClient:
         if self.on_close:
             self.on_close()
     
-    def _on_open(self, ws) -> None:
-        """Handle WebSocket connection open.
-        
-        Args:
-            ws: WebSocket instance
-        """
+    def _on_open(self) -> None:
+        """Handle WebSocket connection open."""
         self.logger.info("WebSocket connection opened")
         
         # Call user-defined callback if set
@@ -155,14 +777,135 @@ class WebSocketClient:
     def send(self, data: Dict[str, Any]) -> None:
         """Send data through WebSocket.
         
+        The message is queued on the event loop; failures are logged.
+        
         Args:
             data: Data to send
         """
+        if self._pending is not None:
+            self._pending.append(data)
+            return
+        
         if not self.ws:
             self.logger.error("WebSocket not connected")
             return
         
+        # Encoded JSON is valid UTF-8, so send the bytes as a text frame
+        future = asyncio.run_coroutine_threadsafe(self.ws.send(self._encode(data), text=True),
+                                                  self._loop)
+        future.add_done_callback(self._on_send_done)
+    
+    def send_many(self, messages: List[Dict[str, Any]]) -> None:
+        """Send several messages with as few frames as possible.
+        
+        Binance accepts any number of streams in one SUBSCRIBE or UNSUBSCRIBE
+        request, so consecutive messages with the same such method are merged
+        into one frame. The frames are written back to back from a single
+        task on the event loop.
+        
+        Args:
+            messages: Messages to send, in order
+        """
+        if not messages:
+            return
+        
+        if not self.ws:
+            self.logger.error("WebSocket not connected")
+            return
+        
+        payloads = [self._encode(data) for data in self._merge_requests(messages)]
+        future = asyncio.run_coroutine_threadsafe(self._send_frames(self.ws, payloads),
+                                                  self._loop)
+        future.add_done_callback(self._on_send_done)
+    
+    @contextmanager
+    def cork(self) -> Iterator[None]:
+        """Buffer send() calls and flush them with send_many() on exit.
+        
+        Example:
+            with client.cork():
+                for symbol in symbols:
+                    client.send({'method': 'SUBSCRIBE', 'params': [...]})
+        """
+        if self._pending is not None:
+            # Already corked; the outermost block flushes
+            yield
+            return
+        
+        self._pending = []
+        try:
+            yield
+        finally:
+            pending, self._pending = self._pending, None
+            self.send_many(pending)
+    
+    def _merge_requests(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Merge runs of SUBSCRIBE or UNSUBSCRIBE requests.
+        
+        Args:
+            messages: Messages to send, in order
+        
+        Returns:
+            Messages with each run of requests of the same stream method
+            replaced by one request for all their streams
+        """
+        merged = []
+        for method, group in itertools.groupby(messages, key=lambda data: data.get('method')):
+            group = list(group)
+            if method not in _STREAM_METHODS or len(group) == 1:
+                merged.extend(group)
+                continue
+            
+            request_id = next((data['id'] for data in group if 'id' in data), None)
+            merged.append({
+                'method': method,
+                'params': [stream for data in group for stream in data.get('params', ())],
+                'id': next(self._request_ids) if request_id is None else request_id
+            })
+        return merged
+    
+    @staticmethod
+    async def _send_frames(ws, payloads: List[bytes]) -> None:
+        """Send encoded messages in order.
+        
+        Args:
+            ws: Open connection
+            payloads: UTF-8 JSON messages
+        """
+        for payload in payloads:
+            await ws.send(payload, text=True)
+    
+    def _encode(self, data: Dict[str, Any]) -> bytes:
+        """Serialize a message, reusing the encoding of repeated control messages.
+        
+        Args:
+            data: Message to send
+        
+        Returns:
+            UTF-8 JSON
+        """
+        if not data.keys() <= _CONTROL_KEYS:
+            return _dumps(data)
+        
         try:
-            self.ws.send(json.dumps(data))
-        except Exception as e:
-            self.logger.error(f"Failed to send WebSocket message: {e}")
+            key = (data.get('method'), tuple(data.get('params', ())), data.get('id'))
+            payload = self._send_cache.get(key)
+        except TypeError:
+            # Unhashable params
+            return _dumps(data)
+        
+        if payload is None:
+            payload = _dumps(data)
+            if len(self._send_cache) >= SEND_CACHE_SIZE:
+                self._send_cache.clear()
+            self._send_cache[key] = payload
+        return payload
+    
+    def _on_send_done(self, future: Future) -> None:
+        """Log a failed send.
+        
+        Args:
+            future: Completed send
+        """
+        if not future.cancelled() and future.exception() is not None:
+            self.logger.error(f"Failed to send WebSocket message: {future.exception()}")